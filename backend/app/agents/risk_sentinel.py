@@ -30,6 +30,9 @@ try:
 except ImportError:
     RISK_CALCULATOR_AVAILABLE = False
 
+# El calculador no guarda estado entre llamadas: una instancia por proceso
+_RISK_CALCULATOR = RiskScoreCalculator(allow_empty_risks=True) if RISK_CALCULATOR_AVAILABLE else None
+
 
 UNIFIED_RISK_PROMPT_ENHANCED = """Eres un auditor de compliance y riesgos para licitaciones. Analiza la respuesta generada contra el contexto del documento.
 
@@ -148,14 +151,13 @@ async def risk_audit(
                             source_agent="RiskSentinel"
                         ))
                     except Exception as conv_err:
-                        logger.warning(f"Skipping malformed risk factor: {conv_err}")
+                        logger.debug("risk_audit", f"Skipping malformed risk factor: {conv_err}")
                 
                 if risk_inputs:
-                    calc = RiskScoreCalculator(allow_empty_risks=True)
-                    assessment = calc.calculate(risk_inputs)
+                    assessment = _RISK_CALCULATOR.calculate(risk_inputs)
                     
                     # Override outcomes based on deterministic calculation
-                    logger.info(f"Risk Score Calculated: {assessment.total_score} ({assessment.recommendation.value})")
+                    logger.debug("risk_audit", f"Risk Score Calculated: {assessment.total_score} ({assessment.recommendation.value})")
                     
                     # Map Recommendation to ComplianceStatus
                     if assessment.recommendation == Recommendation.GO:
@@ -185,7 +187,7 @@ async def risk_audit(
                         issues.append(f"[RiskScore] KILL SWITCH ACTIVATED: {assessment.recommendation_reason}")
 
             except Exception as s_err:
-                logger.error(f"Skill 'risk-score-calculator' execution failed: {s_err}")
+                logger.error("risk_score_calculator", s_err)
         # ------------------------------------------------
 
         # Validaciones finales
@@ -3,13 +3,16 @@
 import json
 import re
 
+# Marcas de bloque de código (```json ... ```) que algunos LLM añaden al JSON
+_CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\n?")
+
 
 def parse_json_response(response: str) -> dict | None:
     """Parsea respuesta JSON del LLM, manejando posibles errores de formato."""
     try:
         clean = response.strip()
         if clean.startswith("```"):
-            clean = re.sub(r"```(?:json)?\n?", "", clean)
+            clean = _CODE_FENCE_PATTERN.sub("", clean)
             clean = clean.rstrip("`")
         return json.loads(clean)
     except json.JSONDecodeError:
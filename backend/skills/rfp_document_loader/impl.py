@@ -15,6 +15,8 @@ import logging
 import os
 import re
 from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +26,12 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+try:
+    import pypdfium2
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
+
 try:
     import pytesseract
     from PIL import Image
@@ -56,6 +64,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Noise normalization patterns (applied in order by _normalize_noise_line)
+_DIGIT_PATTERN = re.compile(r"\d")
+_PAGE_LABEL_PATTERN = re.compile(r"\b(página|page|pág\.?)\s*\d+\b", re.IGNORECASE)
+_PAGE_OF_PATTERN = re.compile(r"\b\d+\s*(de|of|/)\s*\d+\b")
+_STANDALONE_NUMBER_PATTERN = re.compile(r"^\s*\d+\s*$")
+_DATE_PATTERN = re.compile(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}")
+
+# Chunking boundaries
+_PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n\n+")
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
 
 class RFPLoader:
     """
@@ -89,6 +108,18 @@ class RFPLoader:
     HEADER_FOOTER_LINES = 3  # Lines to check for repetitive content
     REPETITION_THRESHOLD = 0.7  # 70% of pages must have same text
     
+    # Table detection: pdfplumber's default "lines" strategy needs ruling
+    # lines, and a header + 1 row table has at least 3 horizontal and
+    # 2 vertical edges
+    MIN_TABLE_H_EDGES = 3
+    MIN_TABLE_V_EDGES = 2
+    
+    # Text backend for the FAST strategy ("pdfplumber" or "pypdfium2").
+    # pypdfium2 is opt-in: it skips layout analysis, so its text can differ
+    # from pdfplumber's in whitespace and reading order.
+    PDF_BACKEND_ENV = "RFP_PDF_BACKEND"
+    DEFAULT_FAST_BACKEND = "pdfplumber"
+    
     def __init__(
         self,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
@@ -103,6 +134,7 @@ class RFPLoader:
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self._backend = os.environ.get(self.PDF_BACKEND_ENV, self.DEFAULT_FAST_BACKEND)
         
         # Validate dependencies
         if not PDFPLUMBER_AVAILABLE:
@@ -117,6 +149,7 @@ class RFPLoader:
         strategy: ProcessingStrategy = ProcessingStrategy.HI_RES,
         extract_tables: bool = True,
         max_pages: int = 500,
+        workers: int = 1,
     ) -> RFPLoaderOutput:
         """
         Load and process a PDF document.
@@ -129,6 +162,9 @@ class RFPLoader:
             strategy: Processing strategy (FAST, OCR_ONLY, HI_RES).
             extract_tables: Whether to detect and convert tables.
             max_pages: Maximum pages to process before timeout.
+            workers: Processes used to parse pages with pdfplumber.
+                With more than one, the page range is split into contiguous
+                shards parsed in parallel.
         
         Returns:
             RFPLoaderOutput with chunks and processing metadata.
@@ -165,6 +201,7 @@ class RFPLoader:
                 strategy=strategy,
                 extract_tables=extract_tables,
                 max_pages=max_pages,
+                workers=workers,
             )
         except Exception as e:
             # Catch pdfplumber specific errors
@@ -190,6 +227,7 @@ class RFPLoader:
         strategy: ProcessingStrategy,
         extract_tables: bool,
         max_pages: int,
+        workers: int = 1,
     ) -> RFPLoaderOutput:
         """Core PDF processing logic."""
         chunks: list[DocumentChunk] = []
@@ -197,6 +235,19 @@ class RFPLoader:
         tables_extracted = 0
         ocr_used = False
         
+        # FAST: native text via PDFium, skipping pdfminer layout analysis
+        if strategy == ProcessingStrategy.FAST and self._use_fast_backend():
+            total_pages, page_texts = self._extract_text_fast(path, max_pages)
+            return self._build_output(
+                path, page_texts, chunks, total_pages, strategy,
+                tables_extracted, ocr_used, warnings,
+            )
+        
+        # Reject oversized documents before pdfminer parses the page tree
+        page_count = self._count_pages(path)
+        if page_count is not None and page_count > max_pages:
+            raise ProcessingTimeoutError(str(path), page_count, max_pages)
+        
         with pdfplumber.open(path) as pdf:
             total_pages = len(pdf.pages)
             
@@ -204,68 +255,167 @@ class RFPLoader:
             if total_pages > max_pages:
                 raise ProcessingTimeoutError(str(path), total_pages, max_pages)
             
-            # Collect all page texts for noise detection
+            if workers > 1 and total_pages > 1:
+                extracted = self._extract_pages_parallel(
+                    path, total_pages, strategy, extract_tables, workers
+                )
+            else:
+                extracted = (
+                    self._extract_page(page, strategy, extract_tables)
+                    for page in pdf.pages
+                )
+            
+            # Collect all page texts; lines are only needed for noise
+            # detection, which runs for HI_RES alone
             page_texts: list[tuple[int, str, list[str]]] = []
+            split_lines = strategy == ProcessingStrategy.HI_RES
             
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Extract text based on strategy
-                if strategy == ProcessingStrategy.OCR_ONLY:
-                    text, page_warnings = self._extract_with_ocr(page)
-                    ocr_used = True
-                    warnings.extend(page_warnings)
-                elif strategy == ProcessingStrategy.FAST:
-                    text = page.extract_text() or ""
-                else:  # HI_RES
-                    # Try native first, fallback to OCR if empty
-                    text = page.extract_text() or ""
-                    if not text.strip() and TESSERACT_AVAILABLE:
-                        text, page_warnings = self._extract_with_ocr(page)
-                        ocr_used = True
-                        warnings.extend(page_warnings)
+            for page_num, (text, tables, page_warnings, page_ocr) in enumerate(extracted, start=1):
+                ocr_used = ocr_used or page_ocr
+                warnings.extend(page_warnings)
                 
-                # Extract tables if requested
-                if extract_tables and strategy != ProcessingStrategy.FAST:
-                    tables = page.extract_tables()
-                    for table in tables:
-                        if table and len(table) > 1:  # At least header + 1 row
-                            table_md = self._table_to_markdown(table)
-                            chunks.append(DocumentChunk(
-                                content=table_md,
-                                page_number=page_num,
-                                chunk_type="table",
-                                source_file=path.name,
-                                metadata={"table_rows": len(table)},
-                            ))
-                            tables_extracted += 1
+                for table in tables:
+                    table_md = self._table_to_markdown(table)
+                    chunks.append(DocumentChunk(
+                        content=table_md,
+                        page_number=page_num,
+                        chunk_type="table",
+                        source_file=path.name,
+                        metadata={"table_rows": len(table)},
+                    ))
+                    tables_extracted += 1
                 
-                # Store for noise detection
-                lines = text.split("\n") if text else []
+                lines = text.split("\n") if text and split_lines else []
                 page_texts.append((page_num, text, lines))
-            
-            # Detect and remove headers/footers
-            if strategy == ProcessingStrategy.HI_RES:
-                noise_patterns = self._detect_noise_patterns(page_texts)
-                page_texts = self._remove_noise(page_texts, noise_patterns)
-                if noise_patterns:
-                    logger.debug(f"Removed {len(noise_patterns)} noise patterns")
-            
-            # Chunk the cleaned text
-            for page_num, text, _ in page_texts:
-                if not text.strip():
-                    continue
-                
-                # Semantic chunking
-                text_chunks = self._semantic_chunk(text)
-                
-                for i, chunk_content in enumerate(text_chunks):
-                    if chunk_content.strip():
-                        chunks.append(DocumentChunk(
-                            content=chunk_content.strip(),
-                            page_number=page_num,
-                            chunk_type="text",
-                            source_file=path.name,
-                            metadata={"chunk_index": i},
-                        ))
+        
+        # Detect and remove headers/footers
+        if strategy == ProcessingStrategy.HI_RES:
+            noise_patterns = self._detect_noise_patterns(page_texts)
+            page_texts = self._remove_noise(page_texts, noise_patterns)
+            if noise_patterns:
+                logger.debug(f"Removed {len(noise_patterns)} noise patterns")
+        
+        return self._build_output(
+            path, page_texts, chunks, total_pages, strategy,
+            tables_extracted, ocr_used, warnings,
+        )
+    
+    def _extract_page(
+        self,
+        page,
+        strategy: ProcessingStrategy,
+        extract_tables: bool,
+    ) -> tuple[str, list[list], list[str], bool]:
+        """
+        Extract text and tables from a single pdfplumber page.
+        
+        Each page is parsed exactly once; the noise detection and
+        chunking steps work on the returned text.
+        
+        Returns:
+            tuple: (text, tables, warnings, ocr_used). Only tables with
+            a header and at least one data row are returned.
+        """
+        warnings: list[str] = []
+        ocr_used = False
+        
+        # Extract text based on strategy
+        if strategy == ProcessingStrategy.OCR_ONLY:
+            text, warnings = self._extract_with_ocr(page)
+            ocr_used = True
+        elif strategy == ProcessingStrategy.FAST:
+            text = page.extract_text() or ""
+        else:  # HI_RES
+            # Try native first, fallback to OCR if empty
+            text = page.extract_text() or ""
+            if not text.strip() and TESSERACT_AVAILABLE:
+                text, warnings = self._extract_with_ocr(page)
+                ocr_used = True
+        
+        # Extract tables if requested
+        tables: list[list] = []
+        if (
+            extract_tables
+            and strategy != ProcessingStrategy.FAST
+            and self._has_ruling_lines(page)
+        ):
+            tables = [
+                table for table in page.extract_tables()
+                if table and len(table) > 1  # At least header + 1 row
+            ]
+        
+        # Text and tables are all that is kept: drop the page's cached
+        # layout objects so memory doesn't grow with the page count
+        page.close()
+        
+        return text, tables, warnings, ocr_used
+    
+    def _has_ruling_lines(self, page) -> bool:
+        """
+        Cheap precheck: does the page have enough edges to hold a table?
+        
+        Edges come from the layout already parsed for the text, while the
+        table finder computes intersections and per-cell text. Pages
+        without ruling lines can't yield a table, so the finder is skipped.
+        """
+        horizontal = vertical = 0
+        for edge in page.edges:
+            if edge["orientation"] == "h":
+                horizontal += 1
+            else:
+                vertical += 1
+        return horizontal >= self.MIN_TABLE_H_EDGES and vertical >= self.MIN_TABLE_V_EDGES
+    
+    def _extract_pages_parallel(
+        self,
+        path: Path,
+        total_pages: int,
+        strategy: ProcessingStrategy,
+        extract_tables: bool,
+        workers: int,
+    ) -> list[tuple[str, list[list], list[str], bool]]:
+        """
+        Extract all pages in worker processes, in page order.
+        
+        Each worker reopens the PDF with only its contiguous shard of
+        pages, so pdfminer parses every page exactly once overall.
+        """
+        shard_size = -(-total_pages // workers)  # ceil division
+        shards = [
+            list(range(first, min(first + shard_size, total_pages + 1)))
+            for first in range(1, total_pages + 1, shard_size)
+        ]
+        
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(_extract_shard, self, str(path), shard, strategy, extract_tables)
+                for shard in shards
+            ]
+            return [page for future in futures for page in future.result()]
+    
+    def _build_output(
+        self,
+        path: Path,
+        page_texts: list[tuple[int, str, list[str]]],
+        chunks: list[DocumentChunk],
+        total_pages: int,
+        strategy: ProcessingStrategy,
+        tables_extracted: int,
+        ocr_used: bool,
+        warnings: list[str],
+    ) -> RFPLoaderOutput:
+        """Chunk the extracted page texts and assemble the output."""
+        for page_num, text, _ in page_texts:
+            # Semantic chunking (chunks come out stripped and non-empty;
+            # blank pages yield none)
+            for i, chunk_content in enumerate(self._semantic_chunk(text)):
+                chunks.append(DocumentChunk(
+                    content=chunk_content,
+                    page_number=page_num,
+                    chunk_type="text",
+                    source_file=path.name,
+                    metadata={"chunk_index": i},
+                ))
         
         logger.info(
             f"Procesado: {total_pages} páginas, {len(chunks)} chunks, "
@@ -281,6 +431,70 @@ class RFPLoader:
             warnings=warnings,
         )
     
+    def _count_pages(self, path: Path) -> Optional[int]:
+        """
+        Read the page count with pypdfium2, without parsing any page.
+        
+        Returns None when pypdfium2 is not installed or cannot open the
+        file; pdfplumber then performs the check (and reports the error).
+        """
+        if not PYPDFIUM2_AVAILABLE:
+            return None
+        
+        try:
+            pdf = pypdfium2.PdfDocument(str(path))
+        except pypdfium2.PdfiumError:
+            return None
+        
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    
+    def _use_fast_backend(self) -> bool:
+        """Whether the FAST strategy should extract text with pypdfium2."""
+        return PYPDFIUM2_AVAILABLE and self._backend == "pypdfium2"
+    
+    def _extract_text_fast(
+        self,
+        path: Path,
+        max_pages: int,
+    ) -> tuple[int, list[tuple[int, str, list[str]]]]:
+        """
+        Extract native text with pypdfium2.
+        
+        Skips pdfminer's per-page layout analysis. A single PdfDocument
+        handle is reused for every page, so the xref table is parsed once.
+        """
+        try:
+            pdf = pypdfium2.PdfDocument(str(path))
+        except pypdfium2.PdfiumError as e:
+            if "password" in str(e).lower():
+                raise EncryptedPDFError(str(path))
+            raise InvalidPDFError(str(path), str(e))
+        try:
+            total_pages = len(pdf)
+            
+            # Check page limit
+            if total_pages > max_pages:
+                raise ProcessingTimeoutError(str(path), total_pages, max_pages)
+            
+            page_texts: list[tuple[int, str, list[str]]] = []
+            for index in range(total_pages):
+                page = pdf.get_page(index)
+                textpage = page.get_textpage()
+                # PDFium separates lines with CRLF
+                text = textpage.get_text_bounded().replace("\r\n", "\n")
+                textpage.close()
+                page.close()
+                
+                # FAST skips noise detection, so lines are never split
+                page_texts.append((index + 1, text, []))
+            
+            return total_pages, page_texts
+        finally:
+            pdf.close()
+    
     def _extract_with_ocr(self, page) -> tuple[str, list[str]]:
         """Extract text from page using OCR."""
         warnings = []
@@ -313,38 +527,28 @@ class RFPLoader:
         if not table:
             return ""
         
-        # Clean cells
-        cleaned = []
-        for row in table:
-            cleaned_row = []
-            for cell in row:
-                cell_text = str(cell) if cell is not None else ""
-                # Remove newlines and excessive whitespace
-                cell_text = re.sub(r"\s+", " ", cell_text).strip()
-                # Escape pipes
-                cell_text = cell_text.replace("|", "\\|")
-                cleaned_row.append(cell_text)
-            cleaned.append(cleaned_row)
-        
-        if not cleaned:
-            return ""
+        # Clean cells: collapse whitespace/newlines and escape pipes
+        cleaned = [
+            [
+                " ".join(str(cell).split()).replace("|", "\\|") if cell is not None else ""
+                for cell in row
+            ]
+            for row in table
+        ]
         
         # Build Markdown table
-        lines = []
-        
-        # Header row
         header = cleaned[0]
-        lines.append("| " + " | ".join(header) + " |")
-        
-        # Separator
-        lines.append("| " + " | ".join(["---"] * len(header)) + " |")
+        width = len(header)
+        lines = [
+            "| " + " | ".join(header) + " |",
+            "| " + " | ".join(["---"] * width) + " |",  # Separator
+        ]
         
-        # Data rows
+        # Data rows, padded/truncated to the header width
         for row in cleaned[1:]:
-            # Pad row if necessary
-            while len(row) < len(header):
-                row.append("")
-            lines.append("| " + " | ".join(row[:len(header)]) + " |")
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            lines.append("| " + " | ".join(row[:width]) + " |")
         
         return "\n".join(lines)
     
@@ -361,62 +565,60 @@ class RFPLoader:
         if len(page_texts) < 3:
             return set()
         
-        # Collect candidate noise lines
-        header_candidates: list[str] = []
-        footer_candidates: list[str] = []
+        # Count candidate noise lines (normalized, ignoring short ones)
+        header_counts: Counter[str] = Counter()
+        footer_counts: Counter[str] = Counter()
+        normalize = self._normalize_noise_line
+        n_lines = self.HEADER_FOOTER_LINES
         
         for _, _, lines in page_texts:
             if not lines:
                 continue
             
-            # Get first/last lines
-            headers = lines[:self.HEADER_FOOTER_LINES]
-            footers = lines[-self.HEADER_FOOTER_LINES:]
-            
-            for line in headers:
-                # Normalize (remove page numbers, dates)
-                normalized = self._normalize_noise_line(line)
-                if normalized and len(normalized) > 5:
-                    header_candidates.append(normalized)
-            
-            for line in footers:
-                normalized = self._normalize_noise_line(line)
-                if normalized and len(normalized) > 5:
-                    footer_candidates.append(normalized)
+            # Normalize first/last lines (remove page numbers, dates)
+            header_counts.update(
+                line for line in map(normalize, lines[:n_lines]) if len(line) > 5
+            )
+            footer_counts.update(
+                line for line in map(normalize, lines[-n_lines:]) if len(line) > 5
+            )
         
         # Find repetitive patterns
-        noise_patterns = set()
         threshold = len(page_texts) * self.REPETITION_THRESHOLD
-        
-        for candidates in [header_candidates, footer_candidates]:
-            counts = Counter(candidates)
-            for pattern, count in counts.items():
-                if count >= threshold:
-                    noise_patterns.add(pattern)
+        noise_patterns = {
+            pattern
+            for counts in (header_counts, footer_counts)
+            for pattern, count in counts.items()
+            if count >= threshold
+        }
         
         return noise_patterns
     
-    def _normalize_noise_line(self, line: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_noise_line(line: str) -> str:
         """
         Normalize a line for noise detection.
         
-        Removes page numbers, dates, and excessive whitespace.
+        Removes page numbers, dates, and excessive whitespace. Memoized:
+        headers/footers repeat verbatim on every page, and each line is
+        normalized again when the noise is removed.
         """
         if not line:
             return ""
         
-        # Remove common page number patterns
-        line = re.sub(r"\b(página|page|pág\.?)\s*\d+\b", "", line, flags=re.IGNORECASE)
-        line = re.sub(r"\b\d+\s*(de|of|/)\s*\d+\b", "", line)
-        line = re.sub(r"^\s*\d+\s*$", "", line)  # Standalone numbers
-        
-        # Remove dates
-        line = re.sub(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}", "", line)
+        # Page numbers and dates all contain digits
+        if _DIGIT_PATTERN.search(line):
+            # Remove common page number patterns
+            line = _PAGE_LABEL_PATTERN.sub("", line)
+            line = _PAGE_OF_PATTERN.sub("", line)
+            line = _STANDALONE_NUMBER_PATTERN.sub("", line)  # Standalone numbers
+            
+            # Remove dates
+            line = _DATE_PATTERN.sub("", line)
         
         # Normalize whitespace
-        line = re.sub(r"\s+", " ", line).strip()
-        
-        return line
+        return " ".join(line.split())
     
     def _remove_noise(
         self,
@@ -427,13 +629,16 @@ class RFPLoader:
         if not noise_patterns:
             return page_texts
         
+        # Normalization never lengthens a line, so shorter lines can't match
+        min_len = min(map(len, noise_patterns))
+        normalize = self._normalize_noise_line
+        
         cleaned = []
         for page_num, text, lines in page_texts:
-            clean_lines = []
-            for line in lines:
-                normalized = self._normalize_noise_line(line)
-                if normalized not in noise_patterns:
-                    clean_lines.append(line)
+            clean_lines = [
+                line for line in lines
+                if len(line) < min_len or normalize(line) not in noise_patterns
+            ]
             
             clean_text = "\n".join(clean_lines)
             cleaned.append((page_num, clean_text, clean_lines))
@@ -445,56 +650,81 @@ class RFPLoader:
         Split text into semantic chunks.
         
         Respects paragraph boundaries and attempts to keep
-        related content together.
+        related content together. Paragraphs are stripped as they are
+        read, so every chunk is non-empty and has no leading/trailing
+        whitespace.
         """
         if not text:
             return []
         
-        # Split by double newlines (paragraphs)
-        paragraphs = re.split(r"\n\n+", text)
+        chunk_size = self.chunk_size
+        chunks: list[str] = []
         
-        chunks = []
-        current_chunk = ""
+        # Paragraphs of the chunk being built, and its joined length
+        parts: list[str] = []
+        length = 0
         
-        for para in paragraphs:
+        # Split by double newlines (paragraphs)
+        for para in _PARAGRAPH_SPLIT_PATTERN.split(text):
             para = para.strip()
             if not para:
                 continue
             
             # If adding this paragraph would exceed chunk size
-            if len(current_chunk) + len(para) + 2 > self.chunk_size:
+            if length + len(para) + 2 > chunk_size:
                 # Save current chunk if not empty
-                if current_chunk:
-                    chunks.append(current_chunk)
+                if parts:
+                    chunks.append("\n\n".join(parts))
                 
-                # If paragraph itself is too long, split it
-                if len(para) > self.chunk_size:
-                    # Split by sentences
-                    sentences = re.split(r"(?<=[.!?])\s+", para)
-                    sub_chunk = ""
+                # If paragraph itself is too long, split it by sentences
+                if len(para) > chunk_size:
+                    sentences: list[str] = []
+                    sub_length = 0
                     
-                    for sentence in sentences:
-                        if len(sub_chunk) + len(sentence) + 1 > self.chunk_size:
-                            if sub_chunk:
-                                chunks.append(sub_chunk)
-                            sub_chunk = sentence
+                    for sentence in _SENTENCE_SPLIT_PATTERN.split(para):
+                        if sentences and sub_length + len(sentence) + 1 <= chunk_size:
+                            sentences.append(sentence)
+                            sub_length += len(sentence) + 1
                         else:
-                            sub_chunk = (sub_chunk + " " + sentence).strip()
+                            if sentences:
+                                chunks.append(" ".join(sentences))
+                            sentences = [sentence]
+                            sub_length = len(sentence)
                     
-                    if sub_chunk:
-                        current_chunk = sub_chunk
-                else:
-                    current_chunk = para
+                    # The last partial sub-chunk keeps accumulating paragraphs
+                    para = " ".join(sentences)
+                
+                parts = [para]
+                length = len(para)
+            elif parts:
+                parts.append(para)
+                length += len(para) + 2
             else:
-                current_chunk = (current_chunk + "\n\n" + para).strip()
+                parts = [para]
+                length = len(para)
         
         # Don't forget the last chunk
-        if current_chunk:
-            chunks.append(current_chunk)
+        if parts:
+            chunks.append("\n\n".join(parts))
         
         return chunks
 
 
+def _extract_shard(
+    loader: RFPLoader,
+    file_path: str,
+    page_numbers: list[int],
+    strategy: ProcessingStrategy,
+    extract_tables: bool,
+) -> list[tuple[str, list[list], list[str], bool]]:
+    """Worker entry point: extract one shard of (1-indexed) pages."""
+    with pdfplumber.open(file_path, pages=page_numbers) as pdf:
+        return [
+            loader._extract_page(page, strategy, extract_tables)
+            for page in pdf.pages
+        ]
+
+
 # Convenience function for simple usage
 def load_rfp_document(
     file_path: str,
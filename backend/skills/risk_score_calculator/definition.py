@@ -35,6 +35,12 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
+# Position of each severity in declaration order, for tuple-indexed tables
+SEVERITY_ORDER: Dict[Severity, int] = {
+    severity: index for index, severity in enumerate(Severity)
+}
+
+
 class Recommendation(str, Enum):
     """Recomendaciones de decisión."""
     GO = "GO"
@@ -42,6 +48,14 @@ class Recommendation(str, Enum):
     REVIEW = "REVIEW"
 
 
+# Traffic-light emoji per recommendation, built once instead of per call
+_TRAFFIC_LIGHT: Dict[Recommendation, str] = {
+    Recommendation.GO: "🟢",
+    Recommendation.REVIEW: "🟡",
+    Recommendation.NO_GO: "🔴",
+}
+
+
 class RiskFactorInput(BaseModel):
     """
     Representa un riesgo individual detectado por un agente.
@@ -187,11 +201,7 @@ class RiskAssessmentOutput(BaseModel):
     
     def get_traffic_light(self) -> str:
         """Retorna el emoji de semáforo según la recomendación."""
-        return {
-            Recommendation.GO: "🟢",
-            Recommendation.REVIEW: "🟡",
-            Recommendation.NO_GO: "🔴",
-        }[self.recommendation]
+        return _TRAFFIC_LIGHT[self.recommendation]
     
     def to_summary(self) -> str:
         """Genera un resumen ejecutivo de una línea."""
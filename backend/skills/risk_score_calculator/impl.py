@@ -11,8 +11,11 @@ Author: TenderCortex Team
 """
 
 import logging
+from bisect import bisect_right
 from typing import Dict, List, Optional
 
+from pydantic import TypeAdapter
+
 try:
     from .definition import (
         CategoryBreakdown,
@@ -24,6 +27,7 @@ try:
         RiskCategory,
         RiskFactorInput,
         RiskMatrixCell,
+        SEVERITY_ORDER,
         Severity,
     )
 except ImportError:
@@ -37,6 +41,7 @@ except ImportError:
         RiskCategory,
         RiskFactorInput,
         RiskMatrixCell,
+        SEVERITY_ORDER,
         Severity,
     )
 
@@ -51,6 +56,10 @@ SEVERITY_WEIGHTS: Dict[Severity, float] = {
     Severity.CRITICAL: 100.0,  # Will trigger kill switch anyway
 }
 
+# Validates all category breakdowns in a single call instead of one
+# model construction per category
+_BREAKDOWN_ADAPTER = TypeAdapter(List[CategoryBreakdown])
+
 # Recommendation thresholds
 THRESHOLD_GO = 70.0
 THRESHOLD_REVIEW = 40.0
@@ -83,6 +92,30 @@ MATRIX_COLORS = {
     ("high", "high"): "red",
 }
 
+# Upper bounds of the probability buckets, in PROBABILITY_THRESHOLDS order
+_PROBABILITY_LEVELS = tuple(PROBABILITY_THRESHOLDS)
+_PROBABILITY_UPPER_BOUNDS = tuple(
+    high for _, high in PROBABILITY_THRESHOLDS.values()
+)
+
+# [severity ordinal][probability bucket] -> (impact, probability),
+# precomputed so the matrix build does two tuple indexes per risk
+_MATRIX_CELL_TABLE: tuple = tuple(
+    tuple(
+        (SEVERITY_TO_IMPACT[severity], prob_level)
+        for prob_level in _PROBABILITY_LEVELS
+    )
+    for severity in Severity
+)
+
+
+def _probability_bucket(probability: float) -> int:
+    """Return the index of the probability bucket (falls back to 'high')."""
+    return min(
+        bisect_right(_PROBABILITY_UPPER_BOUNDS, probability),
+        len(_PROBABILITY_UPPER_BOUNDS) - 1,
+    )
+
 
 class RiskScoreCalculator:
     """
@@ -187,15 +220,15 @@ class RiskScoreCalculator:
         total_score = max(0.0, self.BASE_SCORE - total_penalty)
         
         # Step 4: Build category breakdown
-        breakdown = {}
-        for cat in RiskCategory:
-            cat_score = max(0.0, self.BASE_SCORE - category_penalties[cat])
-            breakdown[cat.value] = CategoryBreakdown(
-                category=cat,
-                score=cat_score,
-                risk_count=category_counts[cat],
-                total_penalty=category_penalties[cat],
-            )
+        breakdown = self._build_breakdown([
+            {
+                "category": cat,
+                "score": max(0.0, self.BASE_SCORE - category_penalties[cat]),
+                "risk_count": category_counts[cat],
+                "total_penalty": category_penalties[cat],
+            }
+            for cat in RiskCategory
+        ])
         
         # Step 5: Determine recommendation
         recommendation, reason = self._determine_recommendation(
@@ -223,15 +256,15 @@ class RiskScoreCalculator:
     
     def _create_perfect_score(self) -> RiskAssessmentOutput:
         """Create a perfect score result for empty risk list."""
-        breakdown = {
-            cat.value: CategoryBreakdown(
-                category=cat,
-                score=100.0,
-                risk_count=0,
-                total_penalty=0.0,
-            )
+        breakdown = self._build_breakdown([
+            {
+                "category": cat,
+                "score": 100.0,
+                "risk_count": 0,
+                "total_penalty": 0.0,
+            }
             for cat in RiskCategory
-        }
+        ])
         
         return RiskAssessmentOutput(
             total_score=100.0,
@@ -260,15 +293,15 @@ class RiskScoreCalculator:
         for risk in all_risks:
             category_counts[risk.category] += 1
         
-        breakdown = {
-            cat.value: CategoryBreakdown(
-                category=cat,
-                score=0.0 if category_counts[cat] > 0 else 100.0,
-                risk_count=category_counts[cat],
-                total_penalty=100.0 if category_counts[cat] > 0 else 0.0,
-            )
+        breakdown = self._build_breakdown([
+            {
+                "category": cat,
+                "score": 0.0 if category_counts[cat] > 0 else 100.0,
+                "risk_count": category_counts[cat],
+                "total_penalty": 100.0 if category_counts[cat] > 0 else 0.0,
+            }
             for cat in RiskCategory
-        }
+        ])
         
         logger.warning(
             f"Kill Switch activated! Critical risks: {critical_flags}"
@@ -291,6 +324,14 @@ class RiskScoreCalculator:
             risk_matrix=self._build_risk_matrix(all_risks),
         )
     
+    def _build_breakdown(
+        self,
+        breakdown_dicts: List[dict],
+    ) -> Dict[str, CategoryBreakdown]:
+        """Validate per-category breakdown dicts in bulk, keyed by category value."""
+        validated = _BREAKDOWN_ADAPTER.validate_python(breakdown_dicts)
+        return {item.category.value: item for item in validated}
+    
     def _determine_recommendation(
         self,
         score: float,
@@ -338,15 +379,9 @@ class RiskScoreCalculator:
         
         # Classify each risk
         for risk in risks:
-            impact = SEVERITY_TO_IMPACT[risk.severity]
-            
-            # Determine probability level
-            prob_level = "high"
-            for level, (low, high) in PROBABILITY_THRESHOLDS.items():
-                if low <= risk.probability < high:
-                    prob_level = level
-                    break
-            
+            impact, prob_level = _MATRIX_CELL_TABLE[SEVERITY_ORDER[risk.severity]][
+                _probability_bucket(risk.probability)
+            ]
             matrix[(impact, prob_level)].append(risk.description)
         
         # Convert to list of RiskMatrixCell
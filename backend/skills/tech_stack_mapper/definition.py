@@ -9,7 +9,7 @@ Author: TenderCortex Team
 
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class TechCategory(str, Enum):
@@ -26,6 +26,12 @@ class TechCategory(str, Enum):
     OTHER = "other"
 
 
+# Position of each category in taxonomy order, for list-indexed buckets
+TECH_CATEGORY_ORDER: Dict[TechCategory, int] = {
+    category: index for index, category in enumerate(TechCategory)
+}
+
+
 class RequirementLevel(str, Enum):
     """
     Nivel de requisito de la tecnología.
@@ -42,8 +48,14 @@ class RequirementLevel(str, Enum):
 class TechEntity(BaseModel):
     """
     Representa una entidad tecnológica extraída y normalizada.
+    
+    Inmutable porque la misma instancia se comparte entre `entities`,
+    las listas por nivel de requisito y `by_category`: modificarla en una
+    lista la cambiaría en todas. No reduce la memoria por instancia.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     raw_text: str = Field(
         ...,
         description="Texto original encontrado en el documento."
@@ -12,9 +12,19 @@ Features:
 Author: TenderCortex Team
 """
 
+import functools
 import logging
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+import sys
+from collections import Counter, defaultdict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 try:
     from .definition import (
@@ -22,6 +32,7 @@ try:
         CompatibilityResult,
         EmptyInputError,
         RequirementLevel,
+        TECH_CATEGORY_ORDER,
         TechCategory,
         TechEntity,
         TechMapperError,
@@ -33,6 +44,7 @@ except ImportError:
         CompatibilityResult,
         EmptyInputError,
         RequirementLevel,
+        TECH_CATEGORY_ORDER,
         TechCategory,
         TechEntity,
         TechMapperError,
@@ -46,7 +58,7 @@ logger = logging.getLogger(__name__)
 # CANONICAL MAPPING DICTIONARY
 # ============================================================================
 
-CANONICAL_MAP: Dict[str, Tuple[str, TechCategory]] = {
+_RAW_CANONICAL_MAP: Dict[str, Tuple[str, TechCategory]] = {
     # ----- JavaScript/TypeScript Ecosystem -----
     "javascript": ("JavaScript", TechCategory.LANGUAGE),
     "js": ("JavaScript", TechCategory.LANGUAGE),
@@ -242,34 +254,259 @@ CANONICAL_MAP: Dict[str, Tuple[str, TechCategory]] = {
     "openapi": ("Swagger/OpenAPI", TechCategory.TOOL),
 }
 
+# Read-only view with interned keys and canonical names, so lookups and the
+# `seen` set compare by pointer and every entity shares one string object
+CANONICAL_MAP: Mapping[str, Tuple[str, TechCategory]] = MappingProxyType({
+    sys.intern(key): (sys.intern(canonical), category)
+    for key, (canonical, category) in _RAW_CANONICAL_MAP.items()
+})
+# The view owns its own dict; the literal is not needed after import
+del _RAW_CANONICAL_MAP
+
 
 # ============================================================================
 # CONTEXT KEYWORDS
 # ============================================================================
 
-MANDATORY_KEYWORDS = [
+MANDATORY_KEYWORDS = [sys.intern(keyword) for keyword in (
     "debe", "deberá", "deberan", "obligatorio", "obligatoria",
     "requerido", "requerida", "imprescindible", "indispensable",
     "excluyente", "necesario", "necesaria", "exigido", "exigida",
     "must", "shall", "required", "mandatory", "essential",
-]
+)]
 
-NICE_TO_HAVE_KEYWORDS = [
+NICE_TO_HAVE_KEYWORDS = [sys.intern(keyword) for keyword in (
     "valorará", "valorara", "deseable", "preferible", "preferente",
     "opcional", "plus", "bonificará", "bonificara", "puntuará",
     "puntuara", "adicional", "ventaja", "bonus",
     "preferred", "bonus", "nice to have", "nice-to-have",
     "optional", "desirable", "advantage",
-]
+)]
 
-FORBIDDEN_KEYWORDS = [
+FORBIDDEN_KEYWORDS = [sys.intern(keyword) for keyword in (
     "no usar", "no utilizar", "prohibido", "prohibida",
     "evitar", "nunca", "migrar desde", "migrar de",
     "reemplazar", "sustituir", "legacy", "obsoleto", "obsoleta",
     "descartado", "descartada", "excluido", "excluida",
     "must not", "forbidden", "avoid", "migrate from",
     "replace", "deprecated", "legacy",
-]
+)]
+
+
+
+def _keyword_weights() -> Dict[str, Tuple[RequirementLevel, int]]:
+    """
+    Map each scanned keyword to its level and weight.
+    
+    A keyword listed twice (e.g. "legacy") scores twice. MANDATORY is the
+    fallback level, so its keywords never change the outcome and are not
+    scanned.
+    """
+    weights: Dict[str, Tuple[RequirementLevel, int]] = {}
+    for level, keywords in (
+        (RequirementLevel.FORBIDDEN, FORBIDDEN_KEYWORDS),
+        (RequirementLevel.NICE_TO_HAVE, NICE_TO_HAVE_KEYWORDS),
+    ):
+        for keyword, weight in Counter(keywords).items():
+            weights[keyword] = (level, weight)
+    return weights
+
+
+_KEYWORD_WEIGHTS = _keyword_weights()
+
+# One scan finds both sentence delimiters and the scanned keywords at the
+# start of a word, longest first. Group 1 is the keyword; it is None for a
+# delimiter.
+_KEYWORD_PATTERN = re.compile(r"[.\n]|\b(" + "|".join(
+    re.escape(keyword)
+    for keyword in sorted(_KEYWORD_WEIGHTS, key=len, reverse=True)
+) + ")")
+
+# Matched keyword -> every keyword it contains at the start of a word.
+# Matches do not overlap, so a shorter keyword inside a longer one
+# ("migrar de" in "migrar desde") is counted through this table.
+_KEYWORD_HITS: Dict[str, Tuple[str, ...]] = {
+    keyword: tuple(
+        other for other in _KEYWORD_WEIGHTS
+        if re.search(r"\b" + re.escape(other), keyword)
+    )
+    for keyword in _KEYWORD_WEIGHTS
+}
+
+# Sentences shorter than this (in words) are direct statements and score 3
+_SHORT_SENTENCE_WORDS: Dict[RequirementLevel, int] = {
+    RequirementLevel.FORBIDDEN: 15,
+    RequirementLevel.NICE_TO_HAVE: 20,
+}
+
+
+# ============================================================================
+# DETECTION PATTERNS
+# ============================================================================
+
+# The mapper itself is stateless. The tech and Go patterns run over text
+# lowercased once per extract() call, so they are compiled without
+# re.IGNORECASE.
+
+@functools.lru_cache(maxsize=None)
+def _tech_pattern() -> "re.Pattern[str]":
+    """
+    Whole-word alternation over all terms, longer matches first.
+    
+    Only needed when pyahocorasick is missing. Compiling the alternation
+    is the most expensive part of importing this module, so it is built
+    on first use instead of at every cold start.
+    """
+    return re.compile(
+        r'\b(' + '|'.join(
+            re.escape(t) for t in sorted(CANONICAL_MAP.keys(), key=len, reverse=True)
+        ) + r')\b'
+    )
+
+
+# Special pattern for "Go" (needs context validation)
+_GO_PATTERN = re.compile(
+    r'\b(en\s+go|con\s+go|golang|go\s+lang|lenguaje\s+go|'
+    r'using\s+go|in\s+go|with\s+go)\b'
+)
+
+# Version right after a tech name: "Java 17", "Python 3.10", ">=3.8"
+_VERSION_PATTERN = re.compile(r'\s*(\d+(?:\.\d+)*|[<>=!]+\s*\d+(?:\.\d+)*)')
+
+
+# ============================================================================
+# KEYWORD AUTOMATON
+# ============================================================================
+
+def _build_tech_automaton():
+    """Build an Aho-Corasick automaton over the CANONICAL_MAP keys."""
+    automaton = ahocorasick.Automaton()
+    for key in CANONICAL_MAP:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import; None when pyahocorasick is not installed
+_TECH_AUTOMATON = _build_tech_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _is_word_char(char: str) -> bool:
+    """Same definition of a word character as regex \\w."""
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Equivalent of regex \\b at position pos of text."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _lower_preserving_offsets(text: str) -> str:
+    """
+    Lowercase text keeping a 1:1 character mapping with the original.
+    
+    A few characters (e.g. 'İ') expand when lowercased; those are kept
+    as-is so match offsets can index into the original text.
+    """
+    lower_text = text.lower()
+    if len(lower_text) == len(text):
+        return lower_text
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+# ============================================================================
+# VERSION & REQUIREMENT LEVEL DETECTION
+# ============================================================================
+
+# Both are pure functions of the context snippet, and RFPs repeat the same
+# boilerplate around technologies, so results are memoized per snippet.
+
+@functools.lru_cache(maxsize=4096)
+def _find_version(context: str, tech_name: str) -> Optional[str]:
+    """Extract version constraint for tech_name from context."""
+    # Look for version near the technology name
+    tech_lower = tech_name.lower()
+    context_lower = context.lower()
+    
+    # Find position of tech
+    pos = context_lower.find(tech_lower)
+    if pos == -1:
+        return None
+    
+    # Look for version within 15 chars after tech name (very close)
+    end_pos = pos + len(tech_name)
+    version_area = context[end_pos:end_pos + 15]
+    
+    # Only match if version starts immediately after tech name
+    # Patterns: "Java 17", "Python 3.10", ">=3.8"
+    match = _VERSION_PATTERN.match(version_area)
+    if match:
+        version = match.group(1)
+        if version:
+            return version.strip()
+    
+    return None
+
+
+def _score_sentence(
+    sentence: str,
+    found: Set[str],
+    scores: Dict[RequirementLevel, int],
+) -> None:
+    """Add the weights of the keywords found in one sentence to scores."""
+    word_count = len(sentence.split())
+    for keyword in found:
+        level, weight = _KEYWORD_WEIGHTS[keyword]
+        # Higher score if the sentence is short (direct statement)
+        if word_count < _SHORT_SENTENCE_WORDS[level]:
+            scores[level] += 3 * weight
+        else:
+            scores[level] += weight
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_level(context_lower: str) -> RequirementLevel:
+    """
+    Score requirement keywords in a lowercased context snippet.
+    
+    Keywords match at the start of a word, so plural and conjugated forms
+    ("deseables", "valorarán", "prohibidos", "avoided") count and a
+    keyword inside another word does not. Each distinct keyword scores
+    once per sentence.
+    """
+    # Score each requirement level
+    scores = {
+        RequirementLevel.FORBIDDEN: 0,
+        RequirementLevel.NICE_TO_HAVE: 0,
+    }
+    
+    # Split by common sentence delimiters (rough heuristic) in the same
+    # pass that finds the keywords
+    sentence_start = 0
+    found: Set[str] = set()
+    for match in _KEYWORD_PATTERN.finditer(context_lower):
+        keyword = match.group(1)
+        if keyword is not None:
+            found.update(_KEYWORD_HITS[keyword])
+            continue
+        if found:
+            _score_sentence(context_lower[sentence_start:match.start()], found, scores)
+            found = set()
+        sentence_start = match.end()
+    if found:
+        _score_sentence(context_lower[sentence_start:], found, scores)
+    
+    # Determine winner (forbidden > nice_to_have > mandatory)
+    if scores[RequirementLevel.FORBIDDEN] >= 2:
+        return RequirementLevel.FORBIDDEN
+    
+    if scores[RequirementLevel.NICE_TO_HAVE] >= 2:
+        return RequirementLevel.NICE_TO_HAVE
+    
+    # Default to mandatory (safer assumption for RFPs)
+    return RequirementLevel.MANDATORY
 
 
 # ============================================================================
@@ -299,36 +536,42 @@ class TechStackMapper:
     # Minimum confidence for ambiguous terms
     AMBIGUOUS_THRESHOLD = 0.6
     
-    def __init__(self):
-        """Initialize the Tech Stack Mapper."""
-        # Build lowercase lookup for faster matching
-        self._build_patterns()
-    
-    def _build_patterns(self):
-        """Build regex patterns for tech detection."""
-        # Sort by length (longer matches first)
-        terms = sorted(CANONICAL_MAP.keys(), key=len, reverse=True)
-        
-        # Build pattern that matches whole words
-        escaped = [re.escape(t) for t in terms]
-        self._tech_pattern = re.compile(
-            r'\b(' + '|'.join(escaped) + r')\b',
-            re.IGNORECASE
-        )
+    def _find_tech_matches(self, lower_text: str) -> List[Tuple[int, int, str]]:
+        """
+        Find technology mentions as (start, end, key) spans.
         
-        # Special pattern for "Go" (needs context validation)
-        self._go_pattern = re.compile(
-            r'\b(en\s+go|con\s+go|golang|go\s+lang|lenguaje\s+go|'
-            r'using\s+go|in\s+go|with\s+go)\b',
-            re.IGNORECASE
-        )
+        Expects text already lowercased with _lower_preserving_offsets, so
+        the spans index into the original text as well. Uses the
+        Aho-Corasick automaton when available, keeping the same semantics
+        as the regex: leftmost, longest, non-overlapping whole-word matches.
+        """
+        if _TECH_AUTOMATON is None:
+            return [
+                (m.start(), m.end(), m.group(0))
+                for m in _tech_pattern().finditer(lower_text)
+            ]
+        
+        candidates: List[Tuple[int, int, str]] = []
+        for end_index, key in _TECH_AUTOMATON.iter(lower_text):
+            start = end_index - len(key) + 1
+            if (
+                _at_word_boundary(lower_text, start)
+                and _at_word_boundary(lower_text, end_index + 1)
+            ):
+                candidates.append((start, -len(key), key))
+        
+        # Leftmost first, longest first for the same start
+        candidates.sort()
+        
+        matches: List[Tuple[int, int, str]] = []
+        last_end = 0
+        for start, neg_length, key in candidates:
+            if start < last_end:
+                continue
+            last_end = start - neg_length
+            matches.append((start, last_end, key))
         
-        # Version pattern
-        self._version_pattern = re.compile(
-            r'(?:v(?:ersion)?\.?\s*)?(\d+(?:\.\d+)*(?:\.\d+)?)'
-            r'|([<>=!]+\s*\d+(?:\.\d+)*)',
-            re.IGNORECASE
-        )
+        return matches
     
     def extract(
         self,
@@ -353,91 +596,112 @@ class TechStackMapper:
         if not text_chunks:
             raise EmptyInputError()
         
-        combined_text = " ".join(text_chunks)
+        # The single-chunk case (extract_tech_stack) needs no copy
+        if len(text_chunks) == 1:
+            combined_text = text_chunks[0]
+        else:
+            combined_text = " ".join(text_chunks)
         if not combined_text.strip():
             raise EmptyInputError()
         
         logger.info(f"Extracting tech stack from {len(text_chunks)} chunks")
         
+        # Lowercased once; offsets are shared with combined_text
+        lower_text = _lower_preserving_offsets(combined_text)
+        
         entities: List[TechEntity] = []
+        # Grouped in the same pass as detection
+        category_buckets: List[List[TechEntity]] = [[] for _ in TechCategory]
+        by_level: Dict[RequirementLevel, List[TechEntity]] = defaultdict(list)
         seen: Set[str] = set()  # Track canonical names to avoid duplicates
+        # One string object per distinct snippet, shared between entities
+        shared_snippets: Dict[str, str] = {}
         warnings: List[str] = []
         
         # Find all tech mentions
-        for match in self._tech_pattern.finditer(combined_text):
-            raw = match.group(0)
-            raw_lower = raw.lower()
-            
-            if raw_lower not in CANONICAL_MAP:
+        for match_start, match_end, key in self._find_tech_matches(lower_text):
+            if key not in CANONICAL_MAP:
                 continue
             
-            canonical, category = CANONICAL_MAP[raw_lower]
+            canonical, category = CANONICAL_MAP[key]
             
             # Skip duplicates
             if canonical in seen:
                 continue
             seen.add(canonical)
             
-            # Get context around match
-            start = max(0, match.start() - self.CONTEXT_WINDOW)
-            end = min(len(combined_text), match.end() + self.CONTEXT_WINDOW)
-            context = combined_text[start:end].strip()
+            # Get context around match. Scoring works on the lowercase
+            # slice; the original-case snippet is only built when returned.
+            start = max(0, match_start - self.CONTEXT_WINDOW)
+            end = min(len(combined_text), match_end + self.CONTEXT_WINDOW)
+            context_lower = sys.intern(lower_text[start:end].strip())
             
             # Extract version if present
-            version = self._extract_version(context, canonical)
+            version = _find_version(context_lower, canonical)
             
             # Determine requirement level from context
-            req_level = self._detect_requirement_level(context)
+            req_level = _detect_level(context_lower)
             
             entity = TechEntity(
-                raw_text=raw,
+                raw_text=combined_text[match_start:match_end],
                 canonical_name=canonical,
                 category=category,
                 version_constraint=version,
                 requirement_level=req_level,
-                context_snippet=context if include_context else "",
+                context_snippet=(
+                    self._shared_snippet(shared_snippets, combined_text, start, end)
+                    if include_context else ""
+                ),
                 confidence=0.9,
             )
             entities.append(entity)
+            category_buckets[TECH_CATEGORY_ORDER[category]].append(entity)
+            by_level[req_level].append(entity)
         
         # Check for "Go" specially (ambiguous)
         if "go" not in seen or "Go" not in seen:
-            for match in self._go_pattern.finditer(combined_text):
+            for match in _GO_PATTERN.finditer(lower_text):
                 if "Go" in seen:
                     continue
                 seen.add("Go")
                 
                 start = max(0, match.start() - self.CONTEXT_WINDOW)
                 end = min(len(combined_text), match.end() + self.CONTEXT_WINDOW)
-                context = combined_text[start:end].strip()
                 
-                req_level = self._detect_requirement_level(context)
+                req_level = _detect_level(
+                    sys.intern(lower_text[start:end].strip())
+                )
                 
                 entity = TechEntity(
-                    raw_text=match.group(0),
+                    raw_text=combined_text[match.start():match.end()],
                     canonical_name="Go",
                     category=TechCategory.LANGUAGE,
                     requirement_level=req_level,
-                    context_snippet=context if include_context else "",
+                    context_snippet=(
+                        self._shared_snippet(shared_snippets, combined_text, start, end)
+                        if include_context else ""
+                    ),
                     confidence=0.85,  # Lower confidence due to ambiguity
                 )
                 entities.append(entity)
+                category_buckets[TECH_CATEGORY_ORDER[TechCategory.LANGUAGE]].append(entity)
+                by_level[req_level].append(entity)
                 warnings.append(
                     f"'Go' detectado con contexto. Verificar si es el lenguaje "
                     f"o el verbo inglés."
                 )
         
-        # Build categorized lists
-        mandatory = [e for e in entities if e.requirement_level == RequirementLevel.MANDATORY]
-        nice_to_have = [e for e in entities if e.requirement_level == RequirementLevel.NICE_TO_HAVE]
-        forbidden = [e for e in entities if e.requirement_level == RequirementLevel.FORBIDDEN]
+        # Categorized lists
+        mandatory = by_level[RequirementLevel.MANDATORY]
+        nice_to_have = by_level[RequirementLevel.NICE_TO_HAVE]
+        forbidden = by_level[RequirementLevel.FORBIDDEN]
         
-        # Group by category
-        by_category: Dict[str, List[TechEntity]] = {}
-        for category in TechCategory:
-            cat_entities = [e for e in entities if e.category == category]
-            if cat_entities:
-                by_category[category.value] = cat_entities
+        # Group by category (keyed by value, in taxonomy order)
+        by_category: Dict[str, List[TechEntity]] = {
+            category.value: bucket
+            for category, bucket in zip(TechCategory, category_buckets)
+            if bucket
+        }
         
         # Calculate compatibility if company_stack provided
         compatibility = None
@@ -465,34 +729,24 @@ class TechStackMapper:
             warnings=warnings,
         )
     
+    @staticmethod
+    def _shared_snippet(
+        shared: Dict[str, str],
+        text: str,
+        start: int,
+        end: int,
+    ) -> str:
+        """Slice a context snippet, reusing an equal one already returned."""
+        snippet = text[start:end].strip()
+        return shared.setdefault(snippet, snippet)
+    
     def _extract_version(
         self,
         context: str,
         tech_name: str,
     ) -> Optional[str]:
         """Extract version constraint from context."""
-        # Look for version near the technology name
-        tech_lower = tech_name.lower()
-        context_lower = context.lower()
-        
-        # Find position of tech
-        pos = context_lower.find(tech_lower)
-        if pos == -1:
-            return None
-        
-        # Look for version within 15 chars after tech name (very close)
-        end_pos = pos + len(tech_name)
-        version_area = context[end_pos:end_pos + 15]
-        
-        # Only match if version starts immediately after tech name
-        # Patterns: "Java 17", "Python 3.10", ">=3.8"
-        match = re.match(r'^\s*(\d+(?:\.\d+)*|[<>=!]+\s*\d+(?:\.\d+)*)', version_area)
-        if match:
-            version = match.group(1)
-            if version:
-                return version.strip()
-        
-        return None
+        return _find_version(sys.intern(context), tech_name)
     
     def _detect_requirement_level(self, context: str, tech_position: int = -1) -> RequirementLevel:
         """
@@ -501,61 +755,7 @@ class TechStackMapper:
         Uses proximity-based scoring: keywords closer to the tech mention
         have more weight. Also respects sentence boundaries.
         """
-        context_lower = context.lower()
-        
-        # Find the sentence containing the tech (rough heuristic)
-        # Split by common sentence delimiters
-        sentences = [s.strip() for s in context_lower.replace('\n', '. ').split('.') if s.strip()]
-        
-        # Score each requirement level
-        scores = {
-            RequirementLevel.FORBIDDEN: 0,
-            RequirementLevel.NICE_TO_HAVE: 0,
-            RequirementLevel.MANDATORY: 0,
-        }
-        
-        # Check each sentence for keywords
-        for sentence in sentences:
-            # FORBIDDEN - only if directly associated
-            for keyword in FORBIDDEN_KEYWORDS:
-                if keyword in sentence:
-                    # Higher score if the sentence is short (direct statement)
-                    word_count = len(sentence.split())
-                    if word_count < 15:
-                        scores[RequirementLevel.FORBIDDEN] += 3
-                    else:
-                        scores[RequirementLevel.FORBIDDEN] += 1
-            
-            # NICE_TO_HAVE
-            for keyword in NICE_TO_HAVE_KEYWORDS:
-                if keyword in sentence:
-                    word_count = len(sentence.split())
-                    if word_count < 20:
-                        scores[RequirementLevel.NICE_TO_HAVE] += 3
-                    else:
-                        scores[RequirementLevel.NICE_TO_HAVE] += 1
-            
-            # MANDATORY
-            for keyword in MANDATORY_KEYWORDS:
-                if keyword in sentence:
-                    word_count = len(sentence.split())
-                    if word_count < 20:
-                        scores[RequirementLevel.MANDATORY] += 3
-                    else:
-                        scores[RequirementLevel.MANDATORY] += 1
-        
-        # Determine winner (forbidden > nice_to_have > mandatory)
-        if scores[RequirementLevel.FORBIDDEN] >= 2:
-            return RequirementLevel.FORBIDDEN
-        
-        if scores[RequirementLevel.NICE_TO_HAVE] >= 2:
-            return RequirementLevel.NICE_TO_HAVE
-        
-        if scores[RequirementLevel.MANDATORY] >= 1:
-            return RequirementLevel.MANDATORY
-        
-        # Default to mandatory (safer assumption for RFPs)
-        return RequirementLevel.MANDATORY
+        return _detect_level(sys.intern(context.lower()))
     
     def _calculate_compatibility(
         self,
@@ -563,41 +763,32 @@ class TechStackMapper:
         company_stack: List[str],
     ) -> CompatibilityResult:
         """Calculate compatibility between RFP requirements and company stack."""
-        company_lower = {s.lower() for s in company_stack}
-        
-        required = {
-            e.canonical_name for e in entities 
-            if e.requirement_level == RequirementLevel.MANDATORY
-        }
-        forbidden = {
-            e.canonical_name for e in entities 
-            if e.requirement_level == RequirementLevel.FORBIDDEN
-        }
+        # Lowercase every name once; dicts keep entity order for the output
+        required: Dict[str, str] = {}
+        forbidden: Dict[str, str] = {}
+        for e in entities:
+            if e.requirement_level == RequirementLevel.MANDATORY:
+                required[e.canonical_name.lower()] = e.canonical_name
+            elif e.requirement_level == RequirementLevel.FORBIDDEN:
+                forbidden[e.canonical_name.lower()] = e.canonical_name
+        
+        company_keys = [s.lower() for s in company_stack]
+        company_lower = set(company_keys)
         
         # Matched: company has and RFP requires
-        matched = [
-            name for name in required 
-            if name.lower() in company_lower
-        ]
+        matched = [name for key, name in required.items() if key in company_lower]
         
         # Missing: RFP requires but company doesn't have
-        missing = [
-            name for name in required 
-            if name.lower() not in company_lower
-        ]
+        missing = [name for key, name in required.items() if key not in company_lower]
         
         # Extra: company has but RFP doesn't require
-        required_lower = {r.lower() for r in required}
         extra = [
-            s for s in company_stack 
-            if s.lower() not in required_lower
+            s for s, key in zip(company_stack, company_keys)
+            if key not in required
         ]
         
         # Conflicts: company uses but RFP forbids
-        conflicts = [
-            name for name in forbidden 
-            if name.lower() in company_lower
-        ]
+        conflicts = [name for key, name in forbidden.items() if key in company_lower]
         
         # Calculate score
         if not required:
@@ -646,6 +837,10 @@ class TechStackMapper:
         return ". ".join(parts) + "." if parts else "No se detectaron tecnologías."
 
 
+# Shared instance for the convenience function (the mapper is stateless)
+_DEFAULT_MAPPER = TechStackMapper()
+
+
 # Convenience function
 def extract_tech_stack(
     text: str,
@@ -656,5 +851,4 @@ def extract_tech_stack(
     
     Convenience function for simple use cases.
     """
-    mapper = TechStackMapper()
-    return mapper.extract([text], company_stack)
+    return _DEFAULT_MAPPER.extract([text], company_stack)
@@ -5,15 +5,29 @@ This module provides common fixtures for testing TenderCortex.
 All fixtures use mocks to avoid real API calls to LLM or vector store services.
 
 Usage:
-    def test_example(mock_llm, test_container):
-        # mock_llm is already configured as AsyncMock
-        # test_container has mocked dependencies
-        pass
+    def test_example(mock_llm_session, test_container):
+        # test_container wraps the session-wide mock_llm_session
+        assert test_container.llm is mock_llm_session
+
+    async def test_other(mock_llm):
+        # mock_llm is a fresh AsyncMock, safe to configure per test
+        mock_llm.ainvoke.return_value.content = "..."
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from langchain_core.documents import Document
+
+# uvloop ships with uvicorn[standard] on Linux/macOS; fall back to asyncio
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 # =============================================================================
 # LLM MOCK FIXTURES
@@ -64,6 +78,24 @@ def mock_llm(mock_llm_response):
     return llm
 
 
+@pytest.fixture(scope="session")
+def mock_llm_session():
+    """
+    Session-wide AsyncMock LLM for tests that only pass it around.
+    
+    Shared by every test in the run, so it must not be configured per test;
+    tests that set return values or side effects should use mock_llm.
+    
+    Usage:
+        def test_example(test_factory, mock_llm_session):
+            agent = test_factory.create("financial")
+            assert agent._llm is mock_llm_session
+    """
+    llm = AsyncMock()
+    llm.ainvoke.return_value = MagicMock(content="Mocked LLM response")
+    return llm
+
+
 # =============================================================================
 # RAG SERVICE MOCK FIXTURES
 # =============================================================================
@@ -89,7 +121,7 @@ def mock_rag_service():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_document():
     """
     Factory fixture for creating sample LangChain Documents.
@@ -98,8 +130,6 @@ def sample_document():
         def test_example(sample_document):
             doc = sample_document("Content here", source="test.pdf")
     """
-    from langchain_core.documents import Document
-    
     def _create_document(
         content: str = "Sample document content",
         source: str = "test_document.pdf",
@@ -112,7 +142,7 @@ def sample_document():
     return _create_document
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_context(sample_document):
     """
     Pre-built list of sample documents for context.
@@ -133,13 +163,14 @@ def sample_context(sample_document):
 # =============================================================================
 
 
-@pytest.fixture
-def test_container(mock_llm):
+@pytest.fixture(scope="session")
+def test_container(mock_llm_session):
     """
     DependencyContainer with mocked LLM for isolated testing.
     
-    This fixture creates a fresh container and overrides the LLM
-    with a mock, enabling unit testing without real API calls.
+    This fixture creates one container per session and overrides the LLM
+    with mock_llm_session, enabling unit testing without real API calls.
+    The factory it builds is stateless, so tests can share it.
     
     Usage:
         def test_example(test_container):
@@ -149,11 +180,11 @@ def test_container(mock_llm):
     from app.services.container import DependencyContainer
     
     container = DependencyContainer()
-    container.override_llm(mock_llm)
+    container.override_llm(mock_llm_session)
     return container
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_factory(test_container):
     """
     AgentFactory instance with mocked dependencies.
@@ -201,3 +232,17 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests"
     )
+    # The loop factory hook below is optional, so an older pytest-asyncio
+    # would silently ignore it and never run tests on uvloop
+    if config.pluginmanager.hook.pytest_asyncio_loop_factories.spec is None:
+        raise pytest.UsageError(
+            "pytest-asyncio>=1.4.0 is required (pip install -r requirements-dev.txt)"
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed."""
+    if UVLOOP_AVAILABLE:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
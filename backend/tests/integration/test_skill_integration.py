@@ -1,45 +1,85 @@
 
-import sys
-import os
 import pytest
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
-
-# Path Setup similar to test_rfp_loader.py to ensure imports work
-backend_path = Path(__file__).parent.parent.parent
-if str(backend_path) not in sys.path:
-    sys.path.insert(0, str(backend_path))
-
-# Set dummy env vars to satisfy Settings validation
-os.environ["GROQ_API_KEY"] = "dummy_groq_key"
-os.environ["HUGGINGFACE_API_KEY"] = "dummy_hf_key"
-os.environ["PINECONE_API_KEY"] = "dummy_pinecone_key"
-os.environ["PINECONE_ENV"] = "dummy_env"
-os.environ["QDRANT_URL"] = "http://localhost:6333"
-os.environ["OPENAI_API_KEY"] = "dummy_openai_key"
-os.environ["TAVILY_API_KEY"] = "dummy_tavily_key"
-
-# Imports from app
-from app.agents.specialists.technical_agent import TechnicalSpecialistAgent
-from app.agents.specialists.financial_agent import FinancialSpecialistAgent
-from app.agents.risk_sentinel import risk_audit
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
 from langchain_core.documents import Document
 from langchain_core.messages import AIMessage
 
-# Mock Skills imports if they fail (for environment w/o deps)
-# But we assume they work as per previous steps.
+# Agent <-> skill wiring; every LLM call is mocked, so these run by default
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module")
+def agents():
+    """
+    Agents under test, imported on first use.
+    
+    Importing app.agents pulls in Settings, LangChain and the Groq client,
+    so it is deferred until a test in this module actually runs instead of
+    being paid during collection (e.g. when deselected with -k or -m).
+    """
+    from app.agents.specialists.technical_agent import TechnicalSpecialistAgent
+    from app.agents.specialists.financial_agent import FinancialSpecialistAgent
+    from app.agents.risk_sentinel import risk_audit
+    
+    return SimpleNamespace(
+        TechnicalSpecialistAgent=TechnicalSpecialistAgent,
+        FinancialSpecialistAgent=FinancialSpecialistAgent,
+        risk_audit=risk_audit,
+    )
+
+# Minimal records for the skill outputs the agents read
+Entity = namedtuple("Entity", ["canonical_name"])
+Row = namedtuple("Row", ["raw_data"])
+
+
+@pytest.fixture(scope="module")
+def fake_tech_result():
+    """Plain stand-in for TechStackOutput (no MagicMock attribute machinery)."""
+    return SimpleNamespace(
+        entities=[Entity("Python"), Entity("PostgreSQL")],
+        stack_summary="STACK DETECTED",
+    )
+
+
+@pytest.fixture(scope="module")
+def fake_financial_result():
+    """Plain stand-in for the financial table parser output."""
+    return SimpleNamespace(
+        tables=[
+            SimpleNamespace(
+                page_number=1,
+                total_detected=1000.0,
+                currency_detected="USD",
+                headers=["Item", "Cost"],
+                headers_original=["Item", "Cost"],
+                rows=[Row({"Item": "Server", "Cost": "1000"})],
+            )
+        ]
+    )
+
+
+def returning(result):
+    """Plain function stand-in that returns `result` and records its calls."""
+    def fake(*args, **kwargs):
+        fake.calls.append((args, kwargs))
+        return result
+    fake.calls = []
+    return fake
+
 
-@pytest.mark.asyncio
 class TestSkillIntegration:
 
-    async def test_technical_agent_uses_tech_mapper(self):
+    async def test_technical_agent_uses_tech_mapper(self, agents, fake_tech_result):
         """Verify TechnicalAgent extracts tech stack and injects it into prompt."""
         
         # Mock LLM
         mock_llm = AsyncMock()
         mock_llm.ainvoke.return_value = AIMessage(content="Analysis complete.")
         
-        agent = TechnicalSpecialistAgent(llm=mock_llm)
+        agent = agents.TechnicalSpecialistAgent(llm=mock_llm)
         
         # Context with obvious tech keywords
         context = [
@@ -49,17 +89,12 @@ class TestSkillIntegration:
         
         # We assume real extract_tech_stack works if imports match.
         # If not, we patch it. Let's patch it to verify call.
-        with patch("app.agents.specialists.technical_agent.extract_tech_stack") as mock_mapper:
-            # Setup mock return
-            mock_result = MagicMock()
-            mock_result.entities = [MagicMock(canonical_name="Python"), MagicMock(canonical_name="PostgreSQL")]
-            mock_result.stack_summary = "STACK DETECTED"
-            mock_mapper.return_value = mock_result
-            
-            response = await agent.generate("Describe the stack", context)
+        fake_mapper = returning(fake_tech_result)
+        with patch("app.agents.specialists.technical_agent.extract_tech_stack", new=fake_mapper):
+            await agent.generate("Describe the stack", context)
             
             # Verify mapper called
-            mock_mapper.assert_called_once()
+            assert len(fake_mapper.calls) == 1
             
             # Verify prompt contained the summary
             call_args = mock_llm.ainvoke.call_args
@@ -72,36 +107,24 @@ class TestSkillIntegration:
             assert "Python" in last_msg
 
 
-    async def test_financial_agent_uses_table_parser(self):
+    async def test_financial_agent_uses_table_parser(self, agents, fake_financial_result):
         """Verify FinancialAgent calls parser and injects tables."""
         
         mock_llm = AsyncMock()
         mock_llm.ainvoke.return_value = AIMessage(content="Budget is 100k.")
         
-        agent = FinancialSpecialistAgent(llm=mock_llm)
+        agent = agents.FinancialSpecialistAgent(llm=mock_llm)
         
         context = [
             Document(page_content="Page text", metadata={"source": "/tmp/test.pdf", "page": 1})
         ]
         
-        with patch("app.agents.specialists.financial_agent.extract_financial_tables") as mock_parser:
-            # Setup mock return
-            mock_table = MagicMock()
-            mock_table.page_number = 1
-            mock_table.total_detected = 1000.0
-            mock_table.currency_detected = "USD"
-            mock_table.headers = ["Item", "Cost"]
-            mock_table.headers_original = ["Item", "Cost"]
-            mock_table.rows = [MagicMock(raw_data={"Item": "Server", "Cost": "1000"})]
-            
-            mock_result = MagicMock()
-            mock_result.tables = [mock_table]
-            mock_parser.return_value = mock_result
-            
+        fake_parser = returning(fake_financial_result)
+        with patch("app.agents.specialists.financial_agent.extract_financial_tables", new=fake_parser):
             await agent.generate("What is the cost?", context)
             
             # Verify parser called
-            mock_parser.assert_called()
+            assert fake_parser.calls
             
             # Verify prompt injection
             messages = mock_llm.ainvoke.call_args[0][0]
@@ -112,7 +135,7 @@ class TestSkillIntegration:
             assert "Server" in prompt
 
 
-    async def test_risk_sentinel_uses_calculator(self):
+    async def test_risk_sentinel_uses_calculator(self, agents):
         """Verify RiskSentinel uses RiskScoreCalculator when JSON contains risk_factors."""
         
         # Mock LLM to return JSON with risk_factors
@@ -145,8 +168,9 @@ class TestSkillIntegration:
             # But High Risk Count = 1.
             # Logic: If High Risk > 0, returns (GO, "but review high risks").
             
-            risk_level, compliance, issues, gate = await risk_audit(
-                answer="Proposed solution cost is high.",
+            risk_level, compliance, issues, gate = await agents.risk_audit(
+                # Long enough (>= 50 chars) that risk_audit doesn't auto-approve it
+                answer="The proposed solution cost is significantly higher than the available budget.",
                 context=[Document(page_content="Budget is low.")],
                 question="Is it viable?"
             )
@@ -0,0 +1,129 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from langchain_core.messages import AIMessage
+
+
+# =============================================================================
+# LLM STUB
+# =============================================================================
+
+
+class FakeLLM:
+    """
+    Minimal async LLM stub.
+    
+    Records the messages of every ``ainvoke`` call without the call
+    tracking and attribute machinery of AsyncMock.
+    
+    Attributes:
+        calls: Messages list passed to each ``ainvoke`` call, in order.
+        return_content: Content of the AIMessage returned by ``ainvoke``.
+        side_effect: Exception raised by ``ainvoke`` instead of returning.
+    """
+    
+    def __init__(self, return_content: str = "Mocked LLM response"):
+        self.calls: List[list] = []
+        self.return_content = return_content
+        self.side_effect: Optional[Exception] = None
+    
+    async def ainvoke(self, messages, *args, **kwargs) -> AIMessage:
+        self.calls.append(messages)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return AIMessage(content=self.return_content)
+
+
+@pytest.fixture
+def mock_llm():
+    """
+    FakeLLM for unit tests (overrides the AsyncMock in tests/conftest.py).
+    
+    Usage:
+        async def test_example(mock_llm):
+            mock_llm.return_content = "Custom"
+            await agent.generate(question, context)
+            messages = mock_llm.calls[-1]
+    """
+    return FakeLLM()
+
+
+@pytest.fixture(scope="module")
+def module_llm():
+    """
+    FakeLLM shared by one test module.
+    
+    For module-scoped fixtures that run an agent once and let several
+    tests assert on the captured calls.
+    """
+    return FakeLLM()
+
+
+# =============================================================================
+# PDFPLUMBER STUBS
+# =============================================================================
+
+
+class FakePage:
+    """
+    Minimal pdfplumber page stub.
+    
+    Returns fixed text and tables without MagicMock's per-attribute
+    child-mock bookkeeping. ``edges`` defaults to a ruling grid
+    (4 horizontal, 4 vertical) when tables are given, so the loader's
+    ruling-line precheck lets them through.
+    """
+    
+    def __init__(
+        self,
+        text: str = "",
+        tables: Optional[list] = None,
+        page_number: int = 1,
+        edges: Optional[list] = None,
+    ):
+        self.page_number = page_number
+        self.text = text
+        self.tables = tables or []
+        if edges is None:
+            edges = [{"orientation": o} for o in "hhhhvvvv"] if self.tables else []
+        self.edges = edges
+    
+    def extract_text(self) -> str:
+        return self.text
+    
+    def extract_tables(self) -> list:
+        return self.tables
+    
+    def close(self) -> None:
+        pass
+
+
+class FakePdf:
+    """Minimal stand-in for the context manager returned by ``pdfplumber.open``."""
+    
+    def __init__(self, pages: list):
+        self.pages = pages
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture(scope="session")
+def fake_pdf():
+    """
+    pdfplumber stub classes.
+    
+    Usage:
+        def test_example(mock_pdfplumber, fake_pdf):
+            page = fake_pdf.Page("Texto de la página")
+            mock_pdfplumber.open.return_value = fake_pdf.Pdf([page])
+    """
+    return SimpleNamespace(Page=FakePage, Pdf=FakePdf)
@@ -5,9 +5,7 @@ Tests the factory pattern implementation for creating specialist agents.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
-from app.agents.agent_factory import AgentFactory
 from app.agents.base import BaseSpecialistAgent
 from app.agents.specialists import (
     FinancialSpecialistAgent,
@@ -19,52 +17,28 @@ from app.agents.specialists import (
 )
 
 
+# (domain, expected agent class) for every migrated domain
+MIGRATED = (
+    ("financial", FinancialSpecialistAgent),
+    ("legal", LegalSpecialistAgent),
+    ("technical", TechnicalSpecialistAgent),
+    ("timeline", TimelineSpecialistAgent),
+    ("requirements", RequirementsSpecialistAgent),
+    ("general", GeneralSpecialistAgent),
+)
+
+
 class TestAgentFactoryCreation:
     """Tests for AgentFactory.create() method."""
 
-    def test_create_financial_agent(self, test_factory):
-        """Factory should create FinancialSpecialistAgent for 'financial' domain."""
-        agent = test_factory.create("financial")
-        
-        assert isinstance(agent, FinancialSpecialistAgent)
-        assert isinstance(agent, BaseSpecialistAgent)
-        assert agent.domain == "financial"
-
-    def test_create_legal_agent(self, test_factory):
-        """Factory should create LegalSpecialistAgent for 'legal' domain."""
-        agent = test_factory.create("legal")
+    @pytest.mark.parametrize(("domain", "expected_cls"), MIGRATED)
+    def test_create_agent(self, test_factory, domain, expected_cls):
+        """Factory should create the specialist agent registered for each domain."""
+        agent = test_factory.create(domain)
         
-        assert isinstance(agent, LegalSpecialistAgent)
+        assert isinstance(agent, expected_cls)
         assert isinstance(agent, BaseSpecialistAgent)
-        assert agent.domain == "legal"
-
-    def test_create_technical_agent(self, test_factory):
-        """Factory should create TechnicalSpecialistAgent for 'technical' domain."""
-        agent = test_factory.create("technical")
-        
-        assert isinstance(agent, TechnicalSpecialistAgent)
-        assert agent.domain == "technical"
-
-    def test_create_timeline_agent(self, test_factory):
-        """Factory should create TimelineSpecialistAgent for 'timeline' domain."""
-        agent = test_factory.create("timeline")
-        
-        assert isinstance(agent, TimelineSpecialistAgent)
-        assert agent.domain == "timeline"
-
-    def test_create_requirements_agent(self, test_factory):
-        """Factory should create RequirementsSpecialistAgent for 'requirements' domain."""
-        agent = test_factory.create("requirements")
-        
-        assert isinstance(agent, RequirementsSpecialistAgent)
-        assert agent.domain == "requirements"
-
-    def test_create_general_agent(self, test_factory):
-        """Factory should create GeneralSpecialistAgent for 'general' domain."""
-        agent = test_factory.create("general")
-        
-        assert isinstance(agent, GeneralSpecialistAgent)
-        assert agent.domain == "general"
+        assert agent.domain == domain
 
 
 class TestAgentFactoryErrorHandling:
@@ -109,12 +83,12 @@ class TestAgentFactoryRegistry:
 class TestAgentFactoryDependencyInjection:
     """Tests for dependency injection in created agents."""
 
-    def test_created_agent_has_injected_llm(self, test_factory, mock_llm):
+    def test_created_agent_has_injected_llm(self, test_factory, mock_llm_session):
         """Created agent should have the factory's LLM injected."""
         agent = test_factory.create("financial")
         
         # The agent should have the mock LLM
-        assert agent._llm is mock_llm
+        assert agent._llm is mock_llm_session
 
     def test_multiple_agents_share_same_llm(self, test_factory):
         """All agents from same factory should share the same LLM instance."""
@@ -5,19 +5,17 @@ Tests the financial specialist agent's generate method with various scenarios.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 from langchain_core.documents import Document
 
 from app.agents.specialists import FinancialSpecialistAgent
-from app.agents.prompts import FINANCIAL_PROMPT
 from app.core.exceptions import AgentProcessingError
 
 
 class TestFinancialAgentEmptyContext:
     """Tests for FinancialSpecialistAgent with empty context."""
 
-    @pytest.mark.asyncio
     async def test_generate_with_empty_context_returns_default_message(self, mock_llm):
         """Agent should return default message when context is empty."""
         agent = FinancialSpecialistAgent(llm=mock_llm)
@@ -29,11 +27,10 @@ class TestFinancialAgentEmptyContext:
         
         assert "No encontré información financiera" in result
         # LLM should NOT be called when context is empty
-        mock_llm.ainvoke.assert_not_called()
+        assert mock_llm.calls == []
 
-    @pytest.mark.asyncio
     async def test_generate_with_whitespace_context_returns_default_message(
-        self, mock_llm, sample_document
+        self, mock_llm
     ):
         """Agent should return default message when context contains only whitespace."""
         agent = FinancialSpecialistAgent(llm=mock_llm)
@@ -49,79 +46,53 @@ class TestFinancialAgentEmptyContext:
         assert "No encontré información financiera" in result
 
 
+FIN_QUESTION = "¿Cuáles son los hitos de pago?"
+FIN_ANSWER = "El presupuesto total es USD 5,000,000."
+
+
+@pytest.fixture(scope="module")
+async def captured_fin_call(module_llm, sample_context):
+    """Run generate() once with context and capture what the LLM received."""
+    module_llm.return_content = FIN_ANSWER
+    agent = FinancialSpecialistAgent(llm=module_llm)
+    
+    result = await agent.generate(
+        question=FIN_QUESTION,
+        context=sample_context,
+    )
+    
+    return SimpleNamespace(result=result, calls=module_llm.calls)
+
+
 class TestFinancialAgentWithContext:
     """Tests for FinancialSpecialistAgent with valid context."""
 
-    @pytest.mark.asyncio
-    async def test_generate_calls_llm_with_context(self, mock_llm, sample_context):
+    def test_generate_calls_llm_with_context(self, captured_fin_call):
         """Agent should call LLM when context has content."""
-        mock_llm.ainvoke.return_value.content = "El presupuesto total es USD 5,000,000."
-        
-        agent = FinancialSpecialistAgent(llm=mock_llm)
-        
-        result = await agent.generate(
-            question="¿Cuál es el presupuesto total?",
-            context=sample_context,
-        )
-        
         # LLM should be called
-        mock_llm.ainvoke.assert_called_once()
+        assert len(captured_fin_call.calls) == 1
         
         # Result should be LLM's response
-        assert result == "El presupuesto total es USD 5,000,000."
+        assert captured_fin_call.result == FIN_ANSWER
 
-    @pytest.mark.asyncio
-    async def test_generate_uses_financial_prompt(self, mock_llm, sample_context):
+    def test_generate_uses_financial_prompt(self, captured_fin_call):
         """Agent should use FINANCIAL_PROMPT in system message."""
-        agent = FinancialSpecialistAgent(llm=mock_llm)
-        
-        await agent.generate(
-            question="¿Cuál es el presupuesto?",
-            context=sample_context,
-        )
-        
         # Get the messages passed to LLM
-        call_args = mock_llm.ainvoke.call_args[0][0]
-        system_message = call_args[0]
+        system_message = captured_fin_call.calls[-1][0]
         
         # System message should contain financial-specific keywords
         assert "FINANCIEROS" in system_message.content or "ECONÓMICOS" in system_message.content
 
-    @pytest.mark.asyncio
-    async def test_generate_includes_question_in_user_message(
-        self, mock_llm, sample_context
-    ):
+    def test_generate_includes_question_in_user_message(self, captured_fin_call):
         """Agent should include the question in user message."""
-        agent = FinancialSpecialistAgent(llm=mock_llm)
-        question = "¿Cuáles son los hitos de pago?"
-        
-        await agent.generate(
-            question=question,
-            context=sample_context,
-        )
-        
-        # Get the messages passed to LLM
-        call_args = mock_llm.ainvoke.call_args[0][0]
-        user_message = call_args[1]
+        user_message = captured_fin_call.calls[-1][1]
         
         # User message should contain the question
-        assert question in user_message.content
+        assert FIN_QUESTION in user_message.content
 
-    @pytest.mark.asyncio
-    async def test_generate_includes_context_in_user_message(
-        self, mock_llm, sample_context
-    ):
+    def test_generate_includes_context_in_user_message(self, captured_fin_call):
         """Agent should include document context in user message."""
-        agent = FinancialSpecialistAgent(llm=mock_llm)
-        
-        await agent.generate(
-            question="¿Cuál es el presupuesto?",
-            context=sample_context,
-        )
-        
-        # Get the messages passed to LLM
-        call_args = mock_llm.ainvoke.call_args[0][0]
-        user_message = call_args[1]
+        user_message = captured_fin_call.calls[-1][1]
         
         # User message should contain content from documents
         assert "USD 5,000,000" in user_message.content
@@ -131,12 +102,11 @@ class TestFinancialAgentWithContext:
 class TestFinancialAgentErrorHandling:
     """Tests for FinancialSpecialistAgent error handling."""
 
-    @pytest.mark.asyncio
     async def test_generate_raises_agent_error_on_llm_failure(
         self, mock_llm, sample_context
     ):
         """Agent should raise AgentProcessingError when LLM fails."""
-        mock_llm.ainvoke.side_effect = Exception("LLM API Error")
+        mock_llm.side_effect = Exception("LLM API Error")
         
         agent = FinancialSpecialistAgent(llm=mock_llm)
         
@@ -175,7 +145,6 @@ class TestFinancialAgentProperties:
 class TestFinancialAgentWithLogger:
     """Tests for FinancialSpecialistAgent logging behavior."""
 
-    @pytest.mark.asyncio
     async def test_generate_logs_entry_and_exit(
         self, mock_llm, mock_logger, sample_context
     ):
@@ -192,12 +161,11 @@ class TestFinancialAgentWithLogger:
         # Should log exit
         mock_logger.node_exit.assert_called()
 
-    @pytest.mark.asyncio
     async def test_generate_logs_error_on_failure(
         self, mock_llm, mock_logger, sample_context
     ):
         """Agent should log errors when generation fails."""
-        mock_llm.ainvoke.side_effect = Exception("Test error")
+        mock_llm.side_effect = Exception("Test error")
         
         agent = FinancialSpecialistAgent(llm=mock_llm, logger=mock_logger)
         
@@ -11,49 +11,21 @@ Tests cover:
 Author: TenderCortex Team
 """
 
-import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from pathlib import Path
 from unittest.mock import MagicMock, patch, PropertyMock
 
-# Add skills directory to path for imports
-import sys
-skills_path = Path(__file__).parent.parent.parent / "skills" / "rfp_document_loader"
-sys.path.insert(0, str(skills_path.parent))
-
-# Now we can import using the package structure
-# Note: Python doesn't allow hyphens in module names, so we use importlib
-import importlib.util
-
-def load_module(module_name: str, file_path: Path):
-    """Dynamically load a module from file path."""
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
-
-# Load definition module
-definition = load_module(
-    "rfp_document_loader_definition",
-    skills_path / "definition.py"
-)
-
-# Extract classes from the loaded module
-DocumentChunk = definition.DocumentChunk
-EncryptedPDFError = definition.EncryptedPDFError
-InvalidPDFError = definition.InvalidPDFError
-ProcessingStrategy = definition.ProcessingStrategy
-ProcessingTimeoutError = definition.ProcessingTimeoutError
-RFPLoaderInput = definition.RFPLoaderInput
-RFPLoaderOutput = definition.RFPLoaderOutput
-
-# Load implementation module
-impl = load_module(
-    "rfp_document_loader_impl",
-    skills_path / "impl.py"
+from rfp_document_loader.definition import (
+    DocumentChunk,
+    EncryptedPDFError,
+    InvalidPDFError,
+    ProcessingStrategy,
+    ProcessingTimeoutError,
+    RFPLoaderInput,
+    RFPLoaderOutput,
 )
-RFPLoader = impl.RFPLoader
+from rfp_document_loader.impl import RFPLoader
 
 
 # =============================================================================
@@ -61,46 +33,61 @@ RFPLoader = impl.RFPLoader
 # =============================================================================
 
 
-@pytest.fixture
-def mock_pdf_page():
-    """Create a mock pdfplumber page."""
-    page = MagicMock()
-    page.page_number = 1
-    page.extract_text.return_value = (
+@pytest.fixture(scope="session")
+def mock_pdf_page(fake_pdf):
+    """Create a stub pdfplumber page (read-only, shared by the session)."""
+    return fake_pdf.Page(
         "LICITACIÓN PÚBLICA INTERNACIONAL\n\n"
         "OBJETO: Adquisición de equipos de cómputo.\n\n"
         "PRESUPUESTO: USD 500,000.00\n\n"
         "El plazo de entrega será de 60 días calendario."
     )
-    page.extract_tables.return_value = []
-    return page
 
 
-@pytest.fixture
-def mock_pdf_with_tables():
-    """Create a mock pdfplumber page with a table."""
-    page = MagicMock()
-    page.page_number = 1
-    page.extract_text.return_value = "Tabla de precios:"
-    page.extract_tables.return_value = [
-        [
-            ["Producto", "Cantidad", "Precio"],
-            ["Laptop", "100", "$1,000"],
-            ["Monitor", "100", "$300"],
-        ]
-    ]
-    return page
+@pytest.fixture(scope="session")
+def mock_pdf_with_tables(fake_pdf):
+    """Create a stub pdfplumber page with a table (read-only, shared by the session)."""
+    return fake_pdf.Page(
+        "Tabla de precios:",
+        tables=[
+            [
+                ["Producto", "Cantidad", "Precio"],
+                ["Laptop", "100", "$1,000"],
+                ["Monitor", "100", "$300"],
+            ]
+        ],
+    )
 
 
-@pytest.fixture
-def mock_pdf_file(tmp_path):
+@pytest.fixture(scope="session")
+def mock_pdf_file(tmp_path_factory):
     """Create a mock PDF file for path validation tests."""
-    pdf_path = tmp_path / "test.pdf"
+    pdf_path = tmp_path_factory.mktemp("pdfs") / "test.pdf"
     # Write PDF magic bytes
     pdf_path.write_bytes(b"%PDF-1.4\n%fake pdf content")
     return pdf_path
 
 
+@pytest.fixture(scope="module")
+def loader():
+    """RFPLoader with default settings (stateless, shared by the module)."""
+    return RFPLoader()
+
+
+@pytest.fixture(scope="module")
+def pdfium_loader():
+    """RFPLoader that opted in to the pypdfium2 FAST backend."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(RFPLoader.PDF_BACKEND_ENV, "pypdfium2")
+        return RFPLoader()
+
+
+@pytest.fixture(scope="module")
+def small_loader():
+    """RFPLoader with small chunks (stateless, shared by the module)."""
+    return RFPLoader(chunk_size=100, chunk_overlap=20)
+
+
 @pytest.fixture
 def mock_invalid_file(tmp_path):
     """Create a non-PDF file."""
@@ -197,19 +184,11 @@ class TestRFPLoader:
     """Tests for RFPLoader class."""
     
     @patch("rfp_document_loader.impl.pdfplumber")
-    def test_load_basic_pdf(self, mock_pdfplumber, mock_pdf_file, mock_pdf_page):
+    def test_load_basic_pdf(self, mock_pdfplumber, mock_pdf_file, mock_pdf_page, fake_pdf, loader):
         """Test loading a basic PDF with text."""
-        from rfp_document_loader.impl import RFPLoader
-        
         # Setup mock
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_pdf_page]
-        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-        mock_pdf.__exit__ = MagicMock(return_value=False)
-        mock_pdfplumber.open.return_value = mock_pdf
+        mock_pdfplumber.open.return_value = fake_pdf.Pdf([mock_pdf_page])
         
-        # Run loader
-        loader = RFPLoader()
         result = loader.load(str(mock_pdf_file))
         
         assert isinstance(result, RFPLoaderOutput)
@@ -218,18 +197,11 @@ class TestRFPLoader:
         assert result.processing_strategy == ProcessingStrategy.HI_RES
     
     @patch("rfp_document_loader.impl.pdfplumber")
-    def test_table_extraction(self, mock_pdfplumber, mock_pdf_file, mock_pdf_with_tables):
+    def test_table_extraction(self, mock_pdfplumber, mock_pdf_file, mock_pdf_with_tables, fake_pdf, loader):
         """Test table extraction and Markdown conversion."""
-        from rfp_document_loader.impl import RFPLoader
-        
         # Setup mock
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_pdf_with_tables]
-        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-        mock_pdf.__exit__ = MagicMock(return_value=False)
-        mock_pdfplumber.open.return_value = mock_pdf
+        mock_pdfplumber.open.return_value = fake_pdf.Pdf([mock_pdf_with_tables])
         
-        loader = RFPLoader()
         result = loader.load(str(mock_pdf_file), extract_tables=True)
         
         assert result.tables_extracted == 1
@@ -243,74 +215,153 @@ class TestRFPLoader:
         assert "|" in table_content
         assert "Producto" in table_content
         assert "Laptop" in table_content
-    
-    def test_file_not_found(self):
+
+    @patch("rfp_document_loader.impl.pdfplumber")
+    def test_table_finder_skipped_without_ruling_lines(self, mock_pdfplumber, mock_pdf_file, mock_pdf_with_tables, fake_pdf, loader):
+        """Test that pages without ruling lines skip table extraction."""
+        page = fake_pdf.Page(
+            mock_pdf_with_tables.text,
+            tables=mock_pdf_with_tables.tables,
+            edges=[{"orientation": "h"}, {"orientation": "h"}],  # Just two rules
+        )
+        mock_pdfplumber.open.return_value = fake_pdf.Pdf([page])
+
+        result = loader.load(str(mock_pdf_file), extract_tables=True)
+
+        assert result.tables_extracted == 0
+        assert all(c.chunk_type == "text" for c in result.chunks)
+
+    def test_file_not_found(self, loader):
         """Test handling of non-existent files."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader()
         with pytest.raises(FileNotFoundError):
             loader.load("/nonexistent/path/to/file.pdf")
     
-    def test_invalid_pdf(self, mock_invalid_file):
+    def test_invalid_pdf(self, mock_invalid_file, loader):
         """Test handling of invalid PDF files."""
-        from rfp_document_loader.impl import RFPLoader
-        
         # Create a .pdf file with wrong content
         pdf_path = mock_invalid_file.parent / "fake.pdf"
         pdf_path.write_text("Not a real PDF")
         
-        loader = RFPLoader()
         with pytest.raises(InvalidPDFError):
             loader.load(str(pdf_path))
     
     @patch("rfp_document_loader.impl.pdfplumber")
-    def test_encrypted_pdf(self, mock_pdfplumber, mock_pdf_file):
+    def test_encrypted_pdf(self, mock_pdfplumber, mock_pdf_file, loader):
         """Test handling of encrypted PDFs."""
-        from rfp_document_loader.impl import RFPLoader
-        
         # Simulate encrypted PDF error
         mock_pdfplumber.open.side_effect = Exception("PDF is password-protected")
         
-        loader = RFPLoader()
         with pytest.raises(EncryptedPDFError):
             loader.load(str(mock_pdf_file))
     
     @patch("rfp_document_loader.impl.pdfplumber")
-    def test_page_limit_exceeded(self, mock_pdfplumber, mock_pdf_file, mock_pdf_page):
+    def test_page_limit_exceeded(self, mock_pdfplumber, mock_pdf_file, mock_pdf_page, fake_pdf, loader):
         """Test handling of documents exceeding page limit."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        # Create 10 mock pages
-        mock_pdf = MagicMock()
-        mock_pdf.pages = [mock_pdf_page] * 10
-        mock_pdf.__enter__ = MagicMock(return_value=mock_pdf)
-        mock_pdf.__exit__ = MagicMock(return_value=False)
-        mock_pdfplumber.open.return_value = mock_pdf
+        # Create 10 stub pages
+        mock_pdfplumber.open.return_value = fake_pdf.Pdf([mock_pdf_page] * 10)
         
-        loader = RFPLoader()
         with pytest.raises(ProcessingTimeoutError):
             loader.load(str(mock_pdf_file), max_pages=5)
     
-    def test_fast_strategy_skips_tables(self):
+    @patch("rfp_document_loader.impl.PYPDFIUM2_AVAILABLE", True)
+    @patch("rfp_document_loader.impl.pypdfium2", create=True)
+    @patch("rfp_document_loader.impl.pdfplumber")
+    def test_page_limit_checked_before_parsing(self, mock_pdfplumber, mock_pdfium, mock_pdf_file, loader):
+        """Test that oversized documents are rejected before pdfplumber opens them."""
+        mock_pdfium.PdfDocument.return_value.__len__.return_value = 10
+
+        with pytest.raises(ProcessingTimeoutError):
+            loader.load(str(mock_pdf_file), max_pages=5)
+
+        mock_pdfplumber.open.assert_not_called()
+        mock_pdfium.PdfDocument.return_value.close.assert_called_once()
+
+    @patch("rfp_document_loader.impl.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("rfp_document_loader.impl.pdfplumber")
+    def test_parallel_workers_keep_page_order(self, mock_pdfplumber, mock_pdf_file, fake_pdf, loader):
+        """Test that sharded extraction merges pages back in order."""
+        def open_pdf(path, pages=None):
+            return fake_pdf.Pdf([
+                fake_pdf.Page(f"Contenido de la sección {n}.", page_number=n)
+                for n in (pages or range(1, 8))
+            ])
+
+        mock_pdfplumber.open.side_effect = open_pdf
+
+        result = loader.load(str(mock_pdf_file), workers=3)
+
+        assert result.total_pages == 7
+        assert [c.page_number for c in result.chunks] == list(range(1, 8))
+        assert result.chunks[4].content == "Contenido de la sección 5."
+        # One open for the page count, then one per shard: [1-3], [4-6], [7]
+        shard_pages = [c.kwargs["pages"] for c in mock_pdfplumber.open.call_args_list[1:]]
+        assert shard_pages == [[1, 2, 3], [4, 5, 6], [7]]
+
+    @patch("rfp_document_loader.impl.pdfplumber")
+    def test_fast_strategy_skips_tables(self, mock_pdfplumber, mock_pdf_file, mock_pdf_with_tables, fake_pdf, loader):
         """Test that FAST strategy skips table extraction."""
-        # This is a unit test for the logic, not full integration
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader()
-        # Just verify the loader can be instantiated
         assert loader.chunk_size == 1000
         assert loader.chunk_overlap == 200
+        mock_pdfplumber.open.return_value = fake_pdf.Pdf([mock_pdf_with_tables])
+
+        result = loader.load(
+            str(mock_pdf_file),
+            strategy=ProcessingStrategy.FAST,
+        )
+
+        # pdfplumber is the default FAST text backend
+        mock_pdfplumber.open.assert_called()
+        assert result.tables_extracted == 0
+        assert result.chunks[0].content == "Tabla de precios:"
+
+    @patch("rfp_document_loader.impl.PYPDFIUM2_AVAILABLE", True)
+    @patch("rfp_document_loader.impl.pypdfium2", create=True)
+    @patch("rfp_document_loader.impl.pdfplumber")
+    def test_fast_strategy_pdfium_backend(self, mock_pdfplumber, mock_pdfium, mock_pdf_file, pdfium_loader):
+        """Test that RFP_PDF_BACKEND=pypdfium2 extracts FAST text with PDFium."""
+        # Setup pypdfium2 mock: one page with native text
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = 1
+        textpage = mock_doc.get_page.return_value.get_textpage.return_value
+        textpage.get_text_bounded.return_value = "OBJETO: Adquisición de equipos.\r\nPlazo: 60 días."
+        mock_pdfium.PdfDocument.return_value = mock_doc
+
+        result = pdfium_loader.load(
+            str(mock_pdf_file),
+            strategy=ProcessingStrategy.FAST,
+        )
+
+        # Fast backend used; pdfplumber (and its table extraction) never opened
+        mock_pdfium.PdfDocument.assert_called_once_with(str(mock_pdf_file))
+        mock_doc.close.assert_called_once()
+        mock_pdfplumber.open.assert_not_called()
+        assert result.tables_extracted == 0
+        assert result.total_pages == 1
+        assert result.chunks[0].content == "OBJETO: Adquisición de equipos.\nPlazo: 60 días."
+
+    @pytest.mark.parametrize("message,expected", [
+        ("Failed to load document (PDFium: Data format error).", InvalidPDFError),
+        ("Failed to load document (PDFium: Incorrect password error).", EncryptedPDFError),
+    ])
+    @patch("rfp_document_loader.impl.PYPDFIUM2_AVAILABLE", True)
+    @patch("rfp_document_loader.impl.pypdfium2", create=True)
+    def test_fast_strategy_pdfium_errors(self, mock_pdfium, message, expected, mock_pdf_file, pdfium_loader):
+        """Test that FAST maps pypdfium2 load errors to loader errors."""
+        class PdfiumError(RuntimeError):
+            pass
+
+        mock_pdfium.PdfiumError = PdfiumError
+        mock_pdfium.PdfDocument.side_effect = PdfiumError(message)
+
+        with pytest.raises(expected):
+            pdfium_loader.load(str(mock_pdf_file), strategy=ProcessingStrategy.FAST)
 
 
 class TestTableToMarkdown:
     """Tests for table to Markdown conversion."""
     
-    def test_basic_table(self):
+    def test_basic_table(self, loader):
         """Test basic table conversion."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader()
         table = [
             ["Header1", "Header2"],
             ["Value1", "Value2"],
@@ -322,11 +373,8 @@ class TestTableToMarkdown:
         assert "| --- | --- |" in result
         assert "| Value1 | Value2 |" in result
     
-    def test_table_with_pipes(self):
+    def test_table_with_pipes(self, loader):
         """Test escaping of pipe characters in cells."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader()
         table = [
             ["Name", "Formula"],
             ["OR Gate", "A|B"],
@@ -335,11 +383,8 @@ class TestTableToMarkdown:
         result = loader._table_to_markdown(table)
         assert "A\\|B" in result  # Pipe should be escaped
     
-    def test_empty_table(self):
+    def test_empty_table(self, loader):
         """Test handling of empty tables."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader()
         assert loader._table_to_markdown([]) == ""
         assert loader._table_to_markdown(None) == ""
 
@@ -347,14 +392,10 @@ class TestTableToMarkdown:
 class TestSemanticChunking:
     """Tests for semantic chunking behavior."""
     
-    def test_respects_paragraphs(self):
+    def test_respects_paragraphs(self, small_loader):
         """Test that chunking respects paragraph boundaries."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader(chunk_size=100, chunk_overlap=20)
-        
         text = "Paragraph one.\n\nParagraph two.\n\nParagraph three."
-        chunks = loader._semantic_chunk(text)
+        chunks = small_loader._semantic_chunk(text)
         
         assert len(chunks) >= 1
         # Each chunk should start with content, not newlines
@@ -363,8 +404,6 @@ class TestSemanticChunking:
     
     def test_handles_long_paragraphs(self):
         """Test chunking of very long paragraphs."""
-        from rfp_document_loader.impl import RFPLoader
-        
         loader = RFPLoader(chunk_size=50, chunk_overlap=10)
         
         # Create a paragraph longer than chunk_size
@@ -382,12 +421,8 @@ class TestSemanticChunking:
 class TestNoiseDetection:
     """Tests for header/footer noise detection."""
     
-    def test_detect_repetitive_headers(self):
+    def test_detect_repetitive_headers(self, loader):
         """Test detection of repetitive headers."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader()
-        
         # Simulate 5 pages with same header
         page_texts = [
             (1, "Company Name\n\nContent page 1", ["Company Name", "", "Content page 1"]),
@@ -402,12 +437,8 @@ class TestNoiseDetection:
         # "Company Name" should be detected as noise
         assert "Company Name" in patterns
     
-    def test_normalize_page_numbers(self):
+    def test_normalize_page_numbers(self, loader):
         """Test that page numbers are normalized out."""
-        from rfp_document_loader.impl import RFPLoader
-        
-        loader = RFPLoader()
-        
         assert loader._normalize_noise_line("Page 1") == ""
         assert loader._normalize_noise_line("página 42") == ""
         assert loader._normalize_noise_line("5 de 10") == ""
@@ -0,0 +1,178 @@
+"""
+Unit tests for Tech Stack Mapper skill.
+
+Tests cover requirement level detection on real RFP wording:
+- Plural and conjugated keyword forms ("valorarán", "prohibidos")
+- Keyword weights (a keyword listed twice scores twice)
+- End-to-end classification through extract_tech_stack
+- Scoring cost against the original substring scorer
+- Same matches with and without the Aho-Corasick automaton
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from tech_stack_mapper.definition import RequirementLevel
+from tech_stack_mapper import impl as tech_impl
+from tech_stack_mapper.impl import (
+    FORBIDDEN_KEYWORDS,
+    MANDATORY_KEYWORDS,
+    NICE_TO_HAVE_KEYWORDS,
+    _detect_level,
+    extract_tech_stack,
+)
+
+
+# (sentence, technology, expected level)
+SENTENCES = (
+    ("Se valorarán conocimientos en Docker.", "Docker", RequirementLevel.NICE_TO_HAVE),
+    ("Son deseables conocimientos de Kubernetes.", "Kubernetes", RequirementLevel.NICE_TO_HAVE),
+    ("Se puntuarán las certificaciones en AWS.", "AWS", RequirementLevel.NICE_TO_HAVE),
+    ("Quedan prohibidos los desarrollos en PHP.", "PHP", RequirementLevel.FORBIDDEN),
+    ("Tecnologías obsoletas como Java.", "Java", RequirementLevel.FORBIDDEN),
+    ("Avoided frameworks: Django.", "Django", RequirementLevel.FORBIDDEN),
+    ("El backend debe desarrollarse en Python.", "Python", RequirementLevel.MANDATORY),
+)
+
+
+class TestDetectLevel:
+    """Tests for keyword-based requirement level scoring."""
+
+    @pytest.mark.parametrize("sentence,tech,expected", SENTENCES)
+    def test_inflected_keywords(self, sentence, tech, expected):
+        """Keywords match at the start of a word, so inflected forms count."""
+        assert _detect_level(sentence.lower()) == expected
+
+    def test_repeated_keyword_keeps_weight(self):
+        """"legacy" is listed twice, so one mention in a long sentence reaches the threshold."""
+        sentence = (
+            "Los sistemas legacy en COBOL y Oracle deberán ser migrados a una "
+            "arquitectura moderna basada en microservicios durante la primera fase."
+        )
+        assert _detect_level(sentence.lower()) == RequirementLevel.FORBIDDEN
+
+    def test_keyword_inside_word_ignored(self):
+        """A keyword in the middle of another word does not count."""
+        assert _detect_level("se requiere conocimiento xprohibido de java") == RequirementLevel.MANDATORY
+
+
+def _reference_level(context_lower):
+    """One search per keyword and sentence: slow, but obviously correct."""
+    scores = {RequirementLevel.FORBIDDEN: 0, RequirementLevel.NICE_TO_HAVE: 0}
+    limits = {RequirementLevel.FORBIDDEN: 15, RequirementLevel.NICE_TO_HAVE: 20}
+    levels = (
+        (RequirementLevel.FORBIDDEN, FORBIDDEN_KEYWORDS),
+        (RequirementLevel.NICE_TO_HAVE, NICE_TO_HAVE_KEYWORDS),
+    )
+    for sentence in re.findall(r"[^.\n]+", context_lower):
+        for level, keywords in levels:
+            hits = sum(
+                keywords.count(k) for k in set(keywords)
+                if re.search(r"\b" + re.escape(k), sentence)
+            )
+            scores[level] += 3 * hits if len(sentence.split()) < limits[level] else hits
+    if scores[RequirementLevel.FORBIDDEN] >= 2:
+        return RequirementLevel.FORBIDDEN
+    if scores[RequirementLevel.NICE_TO_HAVE] >= 2:
+        return RequirementLevel.NICE_TO_HAVE
+    return RequirementLevel.MANDATORY
+
+
+def _substring_level(context_lower):
+    """The original scorer: every keyword tested as a substring of every sentence."""
+    sentences = [s.strip() for s in context_lower.replace("\n", ". ").split(".") if s.strip()]
+    scores = {level: 0 for level in RequirementLevel}
+    for sentence in sentences:
+        for level, keywords, limit in (
+            (RequirementLevel.FORBIDDEN, FORBIDDEN_KEYWORDS, 15),
+            (RequirementLevel.NICE_TO_HAVE, NICE_TO_HAVE_KEYWORDS, 20),
+            (RequirementLevel.MANDATORY, MANDATORY_KEYWORDS, 20),
+        ):
+            for keyword in keywords:
+                if keyword in sentence:
+                    scores[level] += 3 if len(sentence.split()) < limit else 1
+    if scores[RequirementLevel.FORBIDDEN] >= 2:
+        return RequirementLevel.FORBIDDEN
+    if scores[RequirementLevel.NICE_TO_HAVE] >= 2:
+        return RequirementLevel.NICE_TO_HAVE
+    return RequirementLevel.MANDATORY
+
+
+@pytest.fixture(scope="module")
+def keyword_contexts():
+    """Context windows dense in requirement keywords and their inflections."""
+    words = sorted(set(FORBIDDEN_KEYWORDS + NICE_TO_HAVE_KEYWORDS + MANDATORY_KEYWORDS)) + (
+        "valorarán deseables prohibidos avoided legacyness xprohibido "
+        "java python docker el la de y en con . . \n ,"
+    ).split()
+    rng = random.Random(0)
+    return [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 25)))[:110]
+        for _ in range(3000)
+    ]
+
+
+class TestDetectLevelScan:
+    """Tests for the single-regex keyword scan."""
+
+    def test_matches_reference(self, keyword_contexts):
+        """Scoring agrees with a per-keyword search on every context."""
+        for context in keyword_contexts:
+            assert _detect_level.__wrapped__(context) == _reference_level(context), context
+
+    def test_not_slower_than_substring_scorer(self, keyword_contexts):
+        """Uncached scoring is no slower than the original substring scorer."""
+        timings = {_detect_level.__wrapped__: [], _substring_level: []}
+        # Interleaved, best of several rounds, to keep machine noise out
+        for _ in range(5):
+            for fn, runs in timings.items():
+                start = time.perf_counter()
+                for context in keyword_contexts:
+                    fn(context)
+                runs.append(time.perf_counter() - start)
+
+        assert min(timings[_detect_level.__wrapped__]) <= min(timings[_substring_level])
+
+
+class TestExtractTechStack:
+    """Tests for end-to-end classification."""
+
+    @pytest.mark.parametrize("sentence,tech,expected", SENTENCES)
+    def test_requirement_level(self, sentence, tech, expected):
+        """Each technology gets the level of the sentence that mentions it."""
+        result = extract_tech_stack(sentence)
+        levels = {e.canonical_name: e.requirement_level for e in result.entities}
+        assert levels[tech] == expected
+
+
+class TestMatcherBackends:
+    """Tests that the automaton and the regex fallback find the same spans."""
+
+    @pytest.mark.parametrize("text", [
+        "Frontend en JavaScript, backend en Java 17.",
+        "Java y JavaScript; javascript o java.",
+        "Apps en React Native, web en React.js y React JS.",
+        "Spring Boot sobre Spring Framework, y Spring a secas.",
+        "Migración de .NET a .NET Core con ASP.NET.",
+        "Servicios en Node, Node.js y NodeJS.",
+        "İSTANBUL: equipo de Python y Django en Straße 5.",
+        "ÄJava, javaé y _python no son menciones; «Python» y (Rust) sí.",
+        "PYTHON3, Python 3 y python3.10 con C# y CSharp.",
+    ])
+    def test_automaton_matches_regex(self, monkeypatch, text):
+        """extract() returns identical entities and offsets with either backend."""
+        if tech_impl._TECH_AUTOMATON is None:
+            pytest.skip("pyahocorasick not installed")
+
+        def snapshot():
+            mapper = tech_impl.TechStackMapper()
+            lower_text = tech_impl._lower_preserving_offsets(text)
+            result = mapper.extract([text])
+            return mapper._find_tech_matches(lower_text), [e.model_dump() for e in result.entities]
+
+        with_automaton = snapshot()
+        monkeypatch.setattr(tech_impl, "_TECH_AUTOMATON", None)
+        assert snapshot() == with_automaton